@@ -1,8 +1,9 @@
-from os import wait
 from django.contrib import admin
+from django.http import HttpResponseRedirect
+from django.urls import reverse
 from unfold.admin import ModelAdmin
 from unfold.decorators import display
-from .models import User, SiteSetting, Notification
+from .models import User, SiteSetting, Notification, get_singleton_id
 from .forms import SiteSettingForm
 
 
@@ -21,6 +22,7 @@ class UserAdmin(ModelAdmin):
 @admin.register(Notification)
 class NotificationAdmin(ModelAdmin):
     list_display = ('user', 'title', 'created_at', 'read')
+    list_select_related = ('user',)
     search_fields = ('user__email', 'title', 'message')
     list_filter = ('read', 'created_at')
     ordering = ('-created_at',)
@@ -45,7 +47,7 @@ class SiteSettingAdmin(ModelAdmin):
 
     def has_add_permission(self, request):
         # Prevent adding new SiteSetting instances
-        return not SiteSetting.objects.exists()  # Allow add only if no instance exists
+        return get_singleton_id() is None  # Allow add only if no instance exists
 
     def has_delete_permission(self, request, obj=None):
         # Prevent deletion of SiteSetting instances
@@ -53,8 +55,7 @@ class SiteSettingAdmin(ModelAdmin):
 
     def changelist_view(self, request, extra_context=None):
         # Redirect to the change view of the existing SiteSetting instance
-        try:
-            site_setting = SiteSetting.objects.get()
-            return self.change_view(request, object_id=str(site_setting.id))
-        except SiteSetting.DoesNotExist:
-            return super().changelist_view(request, extra_context)
+        site_setting_id = get_singleton_id()
+        if site_setting_id is not None:
+            return HttpResponseRedirect(reverse('admin:accounts_sitesetting_change', args=[site_setting_id]))
+        return super().changelist_view(request, extra_context)
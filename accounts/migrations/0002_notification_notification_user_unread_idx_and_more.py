@@ -0,0 +1,25 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'read', '-created_at'], name='notification_user_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['user', 'is_used', 'expires_at'], name='otp_user_valid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(condition=models.Q(('is_used', False)), fields=['user', 'expires_at'], name='otp_active_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:11
+
+from django.db import migrations, models
+
+
+def create_full_name_trigram_index(apps, schema_editor):
+    # Admin search uses icontains, which only a trigram index can serve (Postgres only)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS user_fullname_trgm '
+        'ON users USING gin (UPPER(full_name::text) gin_trgm_ops)'
+    )
+
+
+def drop_full_name_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_fullname_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_notification_notification_user_unread_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(blank=True, db_index=True, max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(blank=True, db_index=True, max_length=20, null=True),
+        ),
+        migrations.RunPython(create_full_name_trigram_index, drop_full_name_trigram_index),
+    ]
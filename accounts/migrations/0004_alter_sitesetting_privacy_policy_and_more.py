@@ -0,0 +1,36 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+def empty_policies_to_lists(apps, schema_editor):
+    SiteSetting = apps.get_model('accounts', 'SiteSetting')
+    for site_setting in SiteSetting.objects.all():
+        changed = []
+        for field_name in ('privacy_policy', 'terms_of_service'):
+            if getattr(site_setting, field_name) == {}:
+                setattr(site_setting, field_name, [])
+                changed.append(field_name)
+        if changed:
+            site_setting.save(update_fields=changed)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_full_name_alter_user_phone_number'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sitesetting',
+            name='privacy_policy',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='sitesetting',
+            name='terms_of_service',
+            field=models.JSONField(default=list),
+        ),
+        migrations.RunPython(empty_policies_to_lists, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_sitesetting_privacy_policy_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='otp',
+            name='otp_user_valid_idx',
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['user', 'code', 'is_used', 'expires_at'], name='otp_lookup_idx'),
+        ),
+    ]
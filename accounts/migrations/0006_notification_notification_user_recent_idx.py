@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_remove_otp_otp_user_valid_idx_otp_otp_lookup_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='notification_user_recent_idx'),
+        ),
+    ]
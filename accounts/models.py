@@ -1,8 +1,10 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.db import models
+from django.db.models import Q
 import uuid
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from django.core.cache import cache
 
 
 class UserManager(BaseUserManager):
@@ -26,8 +28,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     email = models.EmailField(unique=True, max_length=255)
     username = models.CharField(max_length=150, blank=True, null=True)
-    full_name = models.CharField(max_length=30, blank=True, null=True)
-    phone_number = models.CharField(max_length=20, blank=True, null=True)
+    full_name = models.CharField(max_length=30, blank=True, null=True, db_index=True)
+    phone_number = models.CharField(max_length=20, blank=True, null=True, db_index=True)
 
     avatar = models.ImageField(upload_to='avatars/', blank=True, null=True)
     gender = models.CharField(max_length=20, blank=True, null=True,
@@ -70,6 +72,10 @@ class OTP(models.Model):
         db_table = 'otps'
         verbose_name = 'OTP'
         verbose_name_plural = 'OTPs'
+        indexes = [
+            models.Index(fields=['user', 'code', 'is_used', 'expires_at'], name='otp_lookup_idx'),
+            models.Index(fields=['user', 'expires_at'], condition=Q(is_used=False), name='otp_active_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.email} - {self.code}"
@@ -85,14 +91,20 @@ class Notification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     read = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'read', '-created_at'], name='notification_user_unread_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='notification_user_recent_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.full_name}: {self.message}"
 
 
 
 class SiteSetting(models.Model):
-    privacy_policy = models.JSONField(default=dict)     
-    terms_of_service = models.JSONField(default=dict)     
+    privacy_policy = models.JSONField(default=list)     
+    terms_of_service = models.JSONField(default=list)     
     support_email = models.EmailField(blank=True, null=True)
 
     def save(self, *args, **kwargs):
@@ -100,3 +112,25 @@ class SiteSetting(models.Model):
         if not self.pk and SiteSetting.objects.exists():
             raise ValidationError("Only one SiteSetting instance allowed")
         return super().save(*args, **kwargs)
+
+
+SITE_SETTING_ID_CACHE_KEY = 'site_setting_id'
+
+
+def get_singleton_id():
+    """Return the SiteSetting primary key (or None) for the admin; only a found id is cached"""
+    site_setting_id = cache.get(SITE_SETTING_ID_CACHE_KEY)
+    if site_setting_id is None:
+        site_setting_id = SiteSetting.objects.values_list('id', flat=True).first()
+        if site_setting_id is not None:
+            cache.set(SITE_SETTING_ID_CACHE_KEY, site_setting_id, 3600)
+    return site_setting_id
+
+
+SITE_SETTING_CACHE_KEY = 'site_setting'
+SITE_SETTING_TTL = 300
+
+
+def get_site_setting():
+    """Return the SiteSetting row from the shared cache, reloading it once the TTL runs out"""
+    return cache.get_or_set(SITE_SETTING_CACHE_KEY, SiteSetting.objects.first, SITE_SETTING_TTL)
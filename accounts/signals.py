@@ -1,5 +1,6 @@
-from .models import SiteSetting
-from django.db.models.signals import post_migrate
+from .models import SITE_SETTING_CACHE_KEY, SITE_SETTING_ID_CACHE_KEY, SiteSetting
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
 @receiver(post_migrate)
@@ -7,3 +8,8 @@ def create_site_setting(sender, **kwargs):
     if sender.name == 'accounts':  # Ensure this runs only for the accounts app
         if not SiteSetting.objects.exists():
             SiteSetting.objects.create()  # Create a default SiteSetting instance
+
+@receiver(post_save, sender=SiteSetting)
+@receiver(post_delete, sender=SiteSetting)
+def clear_site_setting_cache(sender, **kwargs):
+    cache.delete_many([SITE_SETTING_CACHE_KEY, SITE_SETTING_ID_CACHE_KEY])
@@ -0,0 +1,182 @@
+(function() {
+    function initPolicyBlocks() {
+        document.querySelectorAll('.policy-blocks-container').forEach(function(container) {
+            if (container.dataset.initialized) return;
+            container.dataset.initialized = 'true';
+
+            var fieldName = container.dataset.fieldName;
+            var blocksList = container.querySelector('.blocks-list');
+            var addBtn = container.querySelector('.add-block-btn');
+            var showMoreBtn = container.querySelector('.show-more-btn');
+
+            if (showMoreBtn) {
+                showMoreBtn.addEventListener('click', function() {
+                    showRemainingBlocks(container, fieldName);
+                });
+            }
+
+            addBtn.addEventListener('click', function() {
+                showRemainingBlocks(container, fieldName);
+
+                var blocks = blocksList.querySelectorAll('.policy-block');
+                var newIndex = blocks.length;
+
+                var noBlocksMsg = blocksList.querySelector('.no-blocks-message');
+                if (noBlocksMsg) noBlocksMsg.remove();
+
+                var blockHtml = createBlockHtml(fieldName, newIndex);
+                var tempDiv = document.createElement('div');
+                tempDiv.innerHTML = blockHtml;
+                var newBlock = tempDiv.firstElementChild;
+                blocksList.appendChild(newBlock);
+
+                attachBlockListeners(newBlock, fieldName);
+                updateBlockNumbers(blocksList);
+            });
+
+            blocksList.querySelectorAll('.policy-block').forEach(function(block) {
+                attachBlockListeners(block, fieldName);
+            });
+        });
+    }
+
+    function showRemainingBlocks(container, fieldName) {
+        var restInput = container.querySelector('.remaining-blocks');
+        if (!restInput) return;
+
+        var blocksList = container.querySelector('.blocks-list');
+        var rest = JSON.parse(restInput.value || '[]');
+        rest.forEach(function(data) {
+            var index = blocksList.querySelectorAll('.policy-block').length;
+            var tempDiv = document.createElement('div');
+            tempDiv.innerHTML = createBlockHtml(fieldName, index);
+            var block = tempDiv.firstElementChild;
+            block.classList.add('collapsed');
+            block.querySelector('.title-input').value = data.title || '';
+            block.querySelector('.block-preview').textContent = data.title || '(Untitled block)';
+            block.querySelector('[name$="_items"]').value = (data.items || []).join('\n');
+            block.querySelector('[name$="_footer"]').value = data.footer || '';
+            blocksList.appendChild(block);
+            attachBlockListeners(block, fieldName);
+        });
+
+        restInput.remove();
+        var showMoreBtn = container.querySelector('.show-more-btn');
+        if (showMoreBtn) showMoreBtn.remove();
+        updateBlockNumbers(blocksList);
+    }
+
+    function createBlockHtml(fieldName, index) {
+        return '<div class="policy-block" data-index="' + index + '">' +
+            '<div class="block-header" onclick="this.parentElement.classList.toggle(\'collapsed\')">' +
+                '<div class="block-header-left">' +
+                    '<span class="collapse-icon">▶</span>' +
+                    '<span class="block-number">#' + (index + 1) + '</span>' +
+                    '<span class="block-preview">(Untitled block)</span>' +
+                '</div>' +
+                '<div class="block-controls" onclick="event.stopPropagation()">' +
+                    '<button type="button" class="move-up-btn" title="Move Up">↑</button>' +
+                    '<button type="button" class="move-down-btn" title="Move Down">↓</button>' +
+                    '<button type="button" class="remove-block-btn" title="Remove">✕</button>' +
+                '</div>' +
+            '</div>' +
+            '<div class="block-fields">' +
+                '<div class="fields-grid">' +
+                    '<div class="field-cell full">' +
+                        '<label>Title</label>' +
+                        '<input type="text" name="' + fieldName + '_block_' + index + '_title" value="" placeholder="Section title" class="title-input">' +
+                    '</div>' +
+                    '<div class="field-cell full">' +
+                        '<label>List Items <small>(one per line)</small></label>' +
+                        '<textarea name="' + fieldName + '_block_' + index + '_items" rows="3" placeholder="Item 1&#10;Item 2&#10;Item 3"></textarea>' +
+                    '</div>' +
+                    '<div class="field-cell full">' +
+                        '<label>Footer</label>' +
+                        '<textarea name="' + fieldName + '_block_' + index + '_footer" rows="2" placeholder="Closing text (optional)"></textarea>' +
+                    '</div>' +
+                '</div>' +
+            '</div>' +
+        '</div>';
+    }
+
+    function attachBlockListeners(block, fieldName) {
+        var blocksList = block.parentElement;
+
+        // Update preview when title changes
+        var titleInput = block.querySelector('.title-input');
+        var preview = block.querySelector('.block-preview');
+        if (titleInput && preview) {
+            titleInput.addEventListener('input', function() {
+                preview.textContent = this.value || '(Untitled block)';
+            });
+        }
+
+        block.querySelector('.remove-block-btn').addEventListener('click', function() {
+            if (confirm('Remove this block?')) {
+                block.remove();
+                reindexBlocks(blocksList, fieldName);
+                updateBlockNumbers(blocksList);
+
+                if (blocksList.querySelectorAll('.policy-block').length === 0) {
+                    var msg = document.createElement('p');
+                    msg.className = 'no-blocks-message';
+                    msg.textContent = 'No blocks yet. Click "+ Add Block" to create one.';
+                    blocksList.appendChild(msg);
+                }
+            }
+        });
+
+        block.querySelector('.move-up-btn').addEventListener('click', function() {
+            var prev = block.previousElementSibling;
+            if (prev && prev.classList.contains('policy-block')) {
+                blocksList.insertBefore(block, prev);
+                reindexBlocks(blocksList, fieldName);
+                updateBlockNumbers(blocksList);
+            }
+        });
+
+        block.querySelector('.move-down-btn').addEventListener('click', function() {
+            var next = block.nextElementSibling;
+            if (!next) {
+                // Last visible block with more still folded away: bring those in first
+                showRemainingBlocks(block.closest('.policy-blocks-container'), fieldName);
+                next = block.nextElementSibling;
+            }
+            if (next && next.classList.contains('policy-block')) {
+                blocksList.insertBefore(next, block);
+                reindexBlocks(blocksList, fieldName);
+                updateBlockNumbers(blocksList);
+            }
+        });
+    }
+
+    function reindexBlocks(blocksList, fieldName) {
+        var blocks = blocksList.querySelectorAll('.policy-block');
+        blocks.forEach(function(block, index) {
+            block.dataset.index = index;
+            var fields = ['title', 'items', 'footer'];
+            fields.forEach(function(field) {
+                var input = block.querySelector('[name*="_' + field + '"]');
+                if (input) input.name = fieldName + '_block_' + index + '_' + field;
+            });
+        });
+    }
+
+    function updateBlockNumbers(blocksList) {
+        var blocks = blocksList.querySelectorAll('.policy-block');
+        var total = blocks.length;
+        blocks.forEach(function(block, index) {
+            block.querySelector('.block-number').textContent = '#' + (index + 1);
+            var upBtn = block.querySelector('.move-up-btn');
+            var downBtn = block.querySelector('.move-down-btn');
+            upBtn.disabled = (index === 0);
+            downBtn.disabled = (index === total - 1);
+        });
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initPolicyBlocks);
+    } else {
+        initPolicyBlocks();
+    }
+})();
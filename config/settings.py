@@ -2,6 +2,8 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 
+from config.voice_app import VoiceAppConfig
+
 load_dotenv(os.getenv("DOTENV_PATH", ".env"))
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -23,7 +25,13 @@ DEBUG = os.getenv("DJANGO_DEBUG", "0") == "1"
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "")
 if not DEBUG and not SECRET_KEY:
     raise RuntimeError("DJANGO_SECRET_KEY must be set in production")
-ALLOWED_HOSTS = ["*"]
+_allowed_hosts = os.getenv("DJANGO_ALLOWED_HOSTS", "")
+if _allowed_hosts.strip():
+    ALLOWED_HOSTS = [h.strip() for h in _allowed_hosts.split(",") if h.strip()]
+elif DEBUG:
+    ALLOWED_HOSTS = ["*"]
+else:
+    ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
 
 # CSRF trustend origins all for now
 CSRF_TRUSTED_ORIGINS = [
@@ -187,6 +195,15 @@ if CHANNEL_BACKEND == "redis":
 else:
     CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
+# Share the Django cache across workers when Redis is available
+if CHANNEL_BACKEND == "redis" and REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
 # ----------------------------
 # Database
 # ----------------------------
@@ -217,6 +234,9 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Spool uploads (voice samples can be large) to a temp file instead of RAM
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", "0"))
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # ----------------------------
@@ -243,52 +263,57 @@ DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 # ----------------------------
 # Voice / AI Settings
 # ----------------------------
-VOICE_APP = {
+VOICE_APP = VoiceAppConfig(
     # Vector DB provider (switch later without rewriting code)
     # "chroma" now, "pinecone" later
-    "VECTOR_DB": os.getenv("VECTOR_DB", "chroma"),
+    vector_db=os.getenv("VECTOR_DB", "chroma"),
 
-    "LLM_PROVIDER": os.getenv("LLM_PROVIDER", "openai"),
-    "STT_PROVIDER": os.getenv("STT_PROVIDER", "openai"),
-    "TTS_PROVIDER": os.getenv("TTS_PROVIDER", "openai"),
+    llm_provider=os.getenv("LLM_PROVIDER", "openai"),
+    stt_provider=os.getenv("STT_PROVIDER", "openai"),
+    tts_provider=os.getenv("TTS_PROVIDER", "openai"),
 
     # Model configs
-    "OPENAI_LLM_MODEL": os.getenv("OPENAI_LLM_MODEL", "gpt-5.2-chat-latest"),
-    "OPENAI_STT_MODEL": os.getenv("OPENAI_STT_MODEL", "gpt-4o-transcribe"),
-    "OPENAI_TTS_MODEL": os.getenv("OPENAI_TTS_MODEL", "gpt-4o-mini-tts"),
-    "OPENAI_TTS_VOICE": os.getenv("OPENAI_TTS_VOICE", "cedar"),
+    openai_llm_model=os.getenv("OPENAI_LLM_MODEL", "gpt-5.2-chat-latest"),
+    openai_stt_model=os.getenv("OPENAI_STT_MODEL", "gpt-4o-transcribe"),
+    openai_tts_model=os.getenv("OPENAI_TTS_MODEL", "gpt-4o-mini-tts"),
+    openai_tts_voice=os.getenv("OPENAI_TTS_VOICE", "cedar"),
 
     # Realtime session options used by consumers.py
-    "OPENAI_RT_VOICE": os.getenv("OPENAI_RT_VOICE", "marin"),
-    "OPENAI_RT_TRANSCRIBE_MODEL": os.getenv("OPENAI_RT_TRANSCRIBE_MODEL", "gpt-4o-transcribe"),
+    openai_rt_voice=os.getenv("OPENAI_RT_VOICE", "marin"),
+    openai_rt_transcribe_model=os.getenv("OPENAI_RT_TRANSCRIBE_MODEL", "gpt-4o-transcribe"),
 
     # OpenAI Realtime WS URL (env-only)
-    "OPENAI_REALTIME_URL": os.getenv("OPENAI_REALTIME_URL", ""),
+    openai_realtime_url=os.getenv("OPENAI_REALTIME_URL", ""),
 
-    "WHISPER_MODEL": os.getenv("WHISPER_MODEL", "base"),
+    whisper_model=os.getenv("WHISPER_MODEL", "base"),
 
     # Chroma persistence location (only used if VECTOR_DB=chroma)
-    "CHROMA_DIR": os.getenv("CHROMA_DIR", str(BASE_DIR / "chroma_db")),
+    chroma_dir=os.getenv("CHROMA_DIR", str(BASE_DIR / "chroma_db")),
 
     # API keys
-    "GROQ_API_KEY": os.getenv("GROQ_API_KEY", ""),
-    "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", ""),
+    groq_api_key=os.getenv("GROQ_API_KEY", ""),
+    openai_api_key=os.getenv("OPENAI_API_KEY", ""),
 
     # ✅ ElevenLabs (voice cloning + streaming TTS)
-    "ELEVENLABS_API_KEY": os.getenv("ELEVENLABS_API_KEY", ""),
-    "ELEVENLABS_BASE_URL": os.getenv("ELEVENLABS_BASE_URL", ""),
-    "ELEVENLABS_DEFAULT_VOICE_ID": os.getenv("ELEVENLABS_DEFAULT_VOICE_ID", ""),
-    "ELEVENLABS_MODEL_ID": os.getenv("ELEVENLABS_MODEL_ID", ""),
+    elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", ""),
+    elevenlabs_base_url=os.getenv("ELEVENLABS_BASE_URL", ""),
+    elevenlabs_default_voice_id=os.getenv("ELEVENLABS_DEFAULT_VOICE_ID", ""),
+    elevenlabs_model_id=os.getenv("ELEVENLABS_MODEL_ID", ""),
+    elevenlabs_min_samples_for_clone=int(os.getenv("ELEVENLABS_MIN_SAMPLES_FOR_CLONE", "1") or 1),
+    elevenlabs_max_files_for_clone=int(os.getenv("ELEVENLABS_MAX_FILES_FOR_CLONE", "5") or 5),
 
     # ChatGPT-like memory settings
-    "AUTO_MEMORY_ENABLED": os.getenv("AUTO_MEMORY_ENABLED", "1") == "1",
-    "OPENAI_MEMORY_MODEL": os.getenv("OPENAI_MEMORY_MODEL", "gpt-4o-mini"),
-    "MEMORY_EXTRACT_MAX_ITEMS": int(os.getenv("MEMORY_EXTRACT_MAX_ITEMS", "3")),
-    "MEMORY_EXTRACT_MIN_INTERVAL_SEC": float(os.getenv("MEMORY_EXTRACT_MIN_INTERVAL_SEC", "12")),
+    auto_memory_enabled=os.getenv("AUTO_MEMORY_ENABLED", "1") == "1",
+    openai_memory_model=os.getenv("OPENAI_MEMORY_MODEL", "gpt-4o-mini"),
+    memory_extract_max_items=int(os.getenv("MEMORY_EXTRACT_MAX_ITEMS", "3")),
+    memory_extract_min_interval_sec=float(os.getenv("MEMORY_EXTRACT_MIN_INTERVAL_SEC", "12")),
 
     # Optional debug override
-    "MEMORY_ALWAYS_EXTRACT": os.getenv("MEMORY_ALWAYS_EXTRACT", "0") == "1",
-}
+    memory_always_extract=os.getenv("MEMORY_ALWAYS_EXTRACT", "0") == "1",
+
+    # Opt-in: stop forwarding idle mic silence to OpenAI (server-VAD mode only)
+    silence_gate_enabled=os.getenv("SILENCE_GATE_ENABLED", "0") == "1",
+)
 
 
 LOGGING = {
@@ -325,5 +350,8 @@ LOGGING = {
             "handlers": ["file", "error_file"],
             "level": "INFO",
         },
+        "main.auth": {  # token debugging stays out of production logs
+            "level": "DEBUG" if DEBUG else "WARNING",
+        },
     },
 }
@@ -4,20 +4,45 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
 from django.views.decorators.csrf import csrf_exempt
-from main.schema import schema
-from main.views import CustomGraphQLView, UserAvatarUpdateView, LovedOneVoiceUploadAPIView, TokenRefreshView
+from django.utils.module_loading import import_string
+from functools import cache
+
+
+@cache
+def _graphql_view():
+    # Build the schema on first request so management commands don't pay for it
+    return import_string("main.views.CustomGraphQLView").as_view(schema=import_string("main.schema.schema"))
+
+
+@csrf_exempt
+def graphql_view(request, *args, **kwargs):
+    return _graphql_view()(request, *args, **kwargs)
+
+
+def _lazy_view(dotted_path):
+    # main.views pulls in the voice stack, so resolve the class on first request too
+    @cache
+    def _view():
+        return import_string(dotted_path).as_view()
+
+    @csrf_exempt
+    def view(request, *args, **kwargs):
+        return _view()(request, *args, **kwargs)
+
+    return view
+
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/voice/", include("voice.urls")),
     path("api/v1/accounts/", include("accounts.urls")),
     path("test/", TemplateView.as_view(template_name="index.html")),
-    path("graphql/", csrf_exempt(CustomGraphQLView.as_view(schema=schema))),
+    path("graphql/", graphql_view),
     path("api/v1/conversations/", include("conversations.urls")),
     path("history/", TemplateView.as_view(template_name="conversations_history.html")),
-    path("api/v1/user/avatar/", UserAvatarUpdateView.as_view(), name="user-avatar-upload"),
-    path("api/v1/loved-one/voice-upload/", LovedOneVoiceUploadAPIView.as_view(), name="loved-one-voice-upload"),
-    path("api/v1/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/v1/user/avatar/", _lazy_view("main.views.UserAvatarUpdateView"), name="user-avatar-upload"),
+    path("api/v1/loved-one/voice-upload/", _lazy_view("main.views.LovedOneVoiceUploadAPIView"), name="loved-one-voice-upload"),
+    path("api/v1/token/refresh/", _lazy_view("main.views.TokenRefreshView"), name="token_refresh"),
 
 
 ]
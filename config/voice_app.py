@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceAppConfig:
+    """Voice pipeline settings, parsed once from the environment at startup."""
+
+    vector_db: str
+    llm_provider: str
+    stt_provider: str
+    tts_provider: str
+    openai_llm_model: str
+    openai_stt_model: str
+    openai_tts_model: str
+    openai_tts_voice: str
+    openai_rt_voice: str
+    openai_rt_transcribe_model: str
+    openai_realtime_url: str
+    whisper_model: str
+    chroma_dir: str
+    groq_api_key: str
+    openai_api_key: str
+    elevenlabs_api_key: str
+    elevenlabs_base_url: str
+    elevenlabs_default_voice_id: str
+    elevenlabs_model_id: str
+    elevenlabs_min_samples_for_clone: int
+    elevenlabs_max_files_for_clone: int
+    auto_memory_enabled: bool
+    openai_memory_model: str
+    memory_extract_max_items: int
+    memory_extract_min_interval_sec: float
+    memory_always_extract: bool
+    silence_gate_enabled: bool
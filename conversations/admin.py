@@ -8,6 +8,8 @@ from .models import ConversationSession, ConversationMessage
 class ConversationSessionAdmin(ModelAdmin):
     list_display = ("id", "user", "loved_one", "last_activity_at")
     search_fields = ("user__email", "loved_one__name")
+    list_select_related = ("user", "loved_one")
+    raw_id_fields = ("user", "loved_one")
 
 
 @admin.register(ConversationMessage)
@@ -15,3 +17,6 @@ class ConversationMessageAdmin(ModelAdmin):
     list_display = ("id", "session", "seq", "role", "created_at")
     list_filter = ("role", "created_at")
     search_fields = ("content",)
+    # Session.__str__ reads the loved one's name, so join through to it
+    list_select_related = ("session__loved_one",)
+    raw_id_fields = ("session",)
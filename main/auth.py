@@ -1,24 +1,37 @@
+import logging
+
 import jwt
-from django.conf import settings
 from accounts.models import User
+from .utils import decode_token
+
+logger = logging.getLogger(__name__)
+
+
+def extract_bearer(header):
+    """Return the token from an ``Authorization: Bearer <token>`` header, or None."""
+    if not header or len(header) < 8 or header[0] not in "Bb" or header[:7].lower() != "bearer ":
+        return None
+    return header[7:].strip() or None
+
 
 def get_user_from_token(token: str) -> User:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = decode_token(token)
         user_id = payload.get("user_id")
-        print("Decoded JWT Payload:", payload)
-        print("Extracted User ID:", user_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JWT payload keys=%s user_id=%s", list(payload), user_id)
         if user_id is None:
             return None
         return User.objects.get(id=user_id)
 
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError, User.DoesNotExist) as e:
-        print("Error:", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JWT rejected: %s", e)
         return None
 
 def get_user_from_refresh_token(token: str):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = decode_token(token)
 
         if payload.get("type") != "refresh":
             return None
@@ -1,12 +1,12 @@
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
-from .auth import get_user_from_token
+from .auth import extract_bearer, get_user_from_token
 
 
 class CustomJWTAuthentication(BaseAuthentication):
     """
     DRF authentication class that validates tokens produced by
-    main.utils.generate_access_token / generate_refresh_token.
+    main.utils.mint_pair.
 
     Replaces rest_framework_simplejwt so the entire project uses
     a single token format.
@@ -15,12 +15,14 @@ class CustomJWTAuthentication(BaseAuthentication):
     keyword = "Bearer"
 
     def authenticate(self, request):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header or not auth_header.startswith(f"{self.keyword} "):
+        token = extract_bearer(request.headers.get("Authorization"))
+        if not token:
             return None  # No credentials — let other authenticators try
 
-        token = auth_header.split(" ", 1)[1]
-        user = get_user_from_token(token)
+        if getattr(request, "_jwt_token", None) == token:
+            user = request._jwt_user  # Already resolved by JWTAuthenticationMiddleware
+        else:
+            user = get_user_from_token(token)
 
         if user is None:
             raise AuthenticationFailed("Invalid or expired token.")
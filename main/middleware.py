@@ -1,15 +1,38 @@
-from django.utils.deprecation import MiddlewareMixin
-from .auth import get_user_from_token
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from .auth import extract_bearer, get_user_from_token
 
-class JWTAuthenticationMiddleware(MiddlewareMixin):
-    def process_request(self, request):
 
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.replace("Bearer ", "")
-            print('Token:', token)
-            user = get_user_from_token(token)
-            print("user:", user)
+class JWTAuthenticationMiddleware:
+    sync_capable = True
+    async_capable = True
 
-            if user:
-                request.user = user
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = extract_bearer(request.META.get("HTTP_AUTHORIZATION"))
+        if token:
+            self._authenticate(request, token, get_user_from_token(token))
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        token = extract_bearer(request.META.get("HTTP_AUTHORIZATION"))
+        if token:
+            # Only hop to a thread when there is actually a token to resolve
+            user = await sync_to_async(get_user_from_token)(token)
+            self._authenticate(request, token, user)
+        return await self.get_response(request)
+
+    @staticmethod
+    def _authenticate(request, token, user):
+        # Downstream authenticators reuse this instead of decoding again
+        request._jwt_token = token
+        request._jwt_user = user
+
+        if user:
+            request.user = user
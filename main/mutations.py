@@ -5,14 +5,25 @@ from .types import (AuthPayload, RefreshPayload, RegisterPayload, VerifyOTPPaylo
 )
 from accounts.models import User, OTP, Notification
 from django.contrib.auth import authenticate
-from .utils import generate_access_token, generate_refresh_token, send_otp_email
+from .utils import mint_pair
+from .tasks import enqueue_otp_email
 from .auth import get_user_from_refresh_token
 from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.core.exceptions import ValidationError
+from django.core.validators import EmailValidator
 from graphql import GraphQLError
 from typing import Optional
 from strawberry.file_uploads import Upload
 from voice.models import LovedOne
 
+_validate_email = EmailValidator()
+
+
+def _valid_otp(email, otp):
+    return OTP.objects.filter(user__email=email, code=otp, is_used=False, expires_at__gt=timezone.now())
+
+
 @strawberry.type
 class Mutation:
     @strawberry.field
@@ -24,8 +35,7 @@ class Mutation:
         user = authenticate(email=email, password=password)
         if user is not None:
             # Generate tokens
-            access_token = generate_access_token(user)
-            refresh_token = generate_refresh_token(user)
+            access_token, refresh_token = mint_pair(user)
             return AuthPayload(
                 access_token=access_token, 
                 refresh_token=refresh_token,
@@ -40,8 +50,7 @@ class Mutation:
     def refresh_token(self, refresh_token: str) -> RefreshPayload:
         user = get_user_from_refresh_token(refresh_token)
         if user is not None:
-            new_access_token = generate_access_token(user)
-            new_refresh_token = generate_refresh_token(user)
+            new_access_token, new_refresh_token = mint_pair(user)
             return RefreshPayload(access_token=new_access_token, refresh_token=new_refresh_token)
         else:
             raise GraphQLError("Invalid refresh token.", extensions={"code": "UNAUTHORIZED"})
@@ -49,71 +58,69 @@ class Mutation:
     @strawberry.field
     def register(self, name: str, email: str, password: str) -> RegisterPayload:
         # Check email format
-        if '@' not in email or '.' not in email.split('@')[-1]:
+        try:
+            _validate_email(email)
+        except ValidationError:
             raise GraphQLError("Invalid email format.", extensions={"code": "BAD_USER_INPUT"})
-        if User.objects.filter(email=email).exists():
-            raise GraphQLError("Email already in use.", extensions={"code": "BAD_USER_INPUT"})
-        
-        user = User.objects.create_user(full_name=name, email=email, password=password, is_active=False)
-        user.save()
         try:
-            send_otp_email(user)
-        except Exception as e:
-            print("Error sending OTP email:", e)
-            raise GraphQLError("Failed to send OTP email. Please try again later.", extensions={"code": "INTERNAL_SERVER_ERROR"})
+            with transaction.atomic():
+                user = User.objects.create_user(full_name=name, email=email, password=password, is_active=False)
+        except IntegrityError:
+            raise GraphQLError("Email already in use.", extensions={"code": "BAD_USER_INPUT"})
+        enqueue_otp_email(user.pk)
         return RegisterPayload(success=True)
     
     @strawberry.field
     def verify_email(self, email: str, otp: int) -> VerifyOTPPayload:
-        try:
-            user = User.objects.get(email=email)
-            if user.is_active:
+        otp_record = _valid_otp(email, otp).select_related("user").only("id", "user").first()
+        if otp_record is None:
+            # Only look the user up again to pick the right error
+            is_active = User.objects.filter(email=email).values_list("is_active", flat=True).first()
+            if is_active is None:
+                raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
+            if is_active:
                 raise GraphQLError("Account already activated.", extensions={"code": "BAD_USER_INPUT"})
-            otp_record = OTP.objects.filter(user=user, code=otp, is_used=False, expires_at__gt=timezone.now()).first()
-            if otp_record is None:
-                raise GraphQLError("Invalid or expired OTP.", extensions={"code": "UNAUTHORIZED"})
-            user.is_active = True
-            user.save()
-            otp_record.is_used = True
-            otp_record.save()
-            return VerifyOTPPayload(success=True, user=user, access_token=generate_access_token(user), refresh_token=generate_refresh_token(user))
-        except User.DoesNotExist:
-            raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
+            raise GraphQLError("Invalid or expired OTP.", extensions={"code": "UNAUTHORIZED"})
+        user = otp_record.user
+        if user.is_active:
+            raise GraphQLError("Account already activated.", extensions={"code": "BAD_USER_INPUT"})
+        with transaction.atomic():
+            User.objects.filter(pk=user.pk).update(is_active=True)
+            OTP.objects.filter(pk=otp_record.pk).update(is_used=True)
+        user.is_active = True
+        access_token, refresh_token = mint_pair(user)
+        return VerifyOTPPayload(success=True, user=user, access_token=access_token, refresh_token=refresh_token)
 
     @strawberry.field
     def sent_otp(self, email:str) -> SentOTPPayload:
         try:
             user = User.objects.get(email=email)
-            send_otp_email(user)
+            enqueue_otp_email(user.pk)
             return SentOTPPayload(success=True)
         except User.DoesNotExist:
             raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
             
     @strawberry.field
     def check_otp(self, email:str, otp:int) -> CheckOTPPayload:
-        try:
-            user = User.objects.get(email=email)
-            otp_record = OTP.objects.filter(user=user, code=otp, is_used=False, expires_at__gt=timezone.now()).first()
-            if otp_record is None:
-                return CheckOTPPayload(valid=False)
+        if _valid_otp(email, otp).exists():
             return CheckOTPPayload(valid=True)
-        except User.DoesNotExist:
+        if not User.objects.filter(email=email).exists():
             raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
+        return CheckOTPPayload(valid=False)
 
     @strawberry.field
     def change_password(self, email:str, otp:int, new_password:str) -> ChangePasswordPayload:
-        try:
-            user = User.objects.get(email=email)
-            otp_record = OTP.objects.filter(user=user, code=otp, is_used=False, expires_at__gt=timezone.now()).first()
-            if otp_record is None:
-                raise GraphQLError("Invalid or expired OTP.", extensions={"code": "UNAUTHORIZED"})
+        otp_record = _valid_otp(email, otp).select_related("user").first()
+        if otp_record is None:
+            if not User.objects.filter(email=email).exists():
+                raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
+            raise GraphQLError("Invalid or expired OTP.", extensions={"code": "UNAUTHORIZED"})
+        user = otp_record.user
+        with transaction.atomic():
             user.set_password(new_password)
-            user.save()
-            otp_record.is_used = True
-            otp_record.save()
-            return ChangePasswordPayload(success=True)
-        except User.DoesNotExist:
-            raise GraphQLError("User not found.", extensions={"code": "NOT_FOUND"})
+            user.save(update_fields=["password"])
+            OTP.objects.filter(pk=otp_record.pk).update(is_used=True)
+        return ChangePasswordPayload(success=True)
 
     @strawberry.field
     def create_or_update_loved_one(self, info, id: Optional[int] = None, name: Optional[str] = None, relationship: Optional[str] = None, nickname_for_user: Optional[str] = None, description: Optional[str] = None, speaking_style: Optional[str] = None, catch_phrase: Optional[str]=None, core_memories: Optional[str]=None, voice_file: Optional[Upload] = None ) -> LovedOneType:
@@ -147,7 +154,6 @@ class Mutation:
             )
             if voice_file is not None:
                 loved_one.voice_file.save(voice_file.name, voice_file)
-                loved_one.save()
             return loved_one
     @strawberry.field
     def mark_notification_read(self, info, id: int) -> MarkNotificationReadPayload:
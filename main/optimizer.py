@@ -0,0 +1,32 @@
+from functools import cache
+
+from strawberry.types.nodes import SelectedField
+from strawberry.utils.str_converters import to_camel_case
+
+
+@cache
+def _field_map(model):
+    """GraphQL field name -> concrete model column for ``model``."""
+    return {
+        to_camel_case(f.name): f.name
+        for f in model._meta.concrete_fields
+        if not f.is_relation
+    }
+
+
+def _selected_names(selections, path):
+    for selection in selections:
+        if not isinstance(selection, SelectedField):
+            # Fragment spreads and inline fragments: look inside them
+            yield from _selected_names(selection.selections, path)
+        elif not path:
+            yield selection.name
+        elif selection.name == path[0]:
+            yield from _selected_names(selection.selections, path[1:])
+
+
+def optimize_queryset(qs, info, path=(), always=("id",)):
+    """Restrict ``qs`` to the columns the query selects under ``path``."""
+    field_map = _field_map(qs.model)
+    names = _selected_names(info.selected_fields[0].selections, path)
+    return qs.only(*always, *{field_map[name] for name in names if name in field_map})
@@ -0,0 +1,26 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+from graphql import GraphQLError
+
+
+def encode_cursor(obj):
+    """Opaque keyset cursor for rows ordered by (-created_at, -id)."""
+    raw = f"{obj.created_at.isoformat()}|{obj.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        created_at, _, pk = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise GraphQLError("Invalid cursor.", extensions={"code": "BAD_USER_INPUT"})
+
+
+def after_cursor(qs, cursor):
+    """Restrict ``qs`` to the rows that come after ``cursor``."""
+    created_at, pk = decode_cursor(cursor)
+    return qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
@@ -1,17 +1,33 @@
-from os import wait
 import strawberry
 from .types import MeResponse, LovedOneType, SiteSettingType, NotificationType, LovedOnePagination
-from graphql import GraphQLError
+from graphql import FieldNode, FragmentSpreadNode, GraphQLError, InlineFragmentNode
 from voice.models import LovedOne
 from typing import Optional
-from accounts.models import SiteSetting, Notification
+from accounts.models import SITE_SETTING_TTL, Notification, get_site_setting
+from django.db.models import Count, Window
+from .pagination import after_cursor, encode_cursor
+from .optimizer import optimize_queryset
+
+def _root_field_names(selection_set, fragments):
+    """Names of the root fields an operation selects, with fragments expanded"""
+    names = set()
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            names.add(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            names |= _root_field_names(selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                names |= _root_field_names(fragment.selection_set, fragments)
+    return names
+
 
 @strawberry.type
 class Query:
     @strawberry.field
     def me(self, info) -> MeResponse:
         user = info.context.get("request").user
-        print(user)
         if user is None or user.is_anonymous:
            raise GraphQLError("Authentication failed", extensions={"code": "UNAUTHENTICATED"})
         return MeResponse(
@@ -24,7 +40,8 @@ class Query:
         info,
         limit: int = 10,
         offset: int = 0,
-        id: Optional[int] = None
+        id: Optional[int] = None,
+        after: Optional[str] = None
     ) -> LovedOnePagination:
 
         user = info.context.get("request").user
@@ -34,40 +51,63 @@ class Query:
                 extensions={"code": "UNAUTHENTICATED"}
             )
 
-        qs = LovedOne.objects.filter(user=user).order_by("-created_at")
+        qs = LovedOne.objects.filter(user=user).order_by("-created_at", "-id")
+        # Skip the large text columns unless the client asked for them
+        qs = optimize_queryset(qs, info, path=("items",), always=("id", "created_at"))
 
         if id is not None:
-            try:
-                loved_one = qs.get(id=id)
-                return LovedOnePagination(
-                    total_count=1,
-                    items=[loved_one]
-                )
-            except LovedOne.DoesNotExist:
+            loved_one = qs.filter(id=id).first()
+            if loved_one is None:
                 raise GraphQLError(
                     "Loved one not found",
                     extensions={"code": "NOT_FOUND"}
                 )
+            return LovedOnePagination(
+                total_count=1,
+                items=[loved_one]
+            )
 
-        total_count = qs.count()
-        items = qs[offset:offset + limit]
+        if after:
+            # Keyset page: the window would only count rows after the cursor
+            items = list(after_cursor(qs, after)[offset:offset + limit])
+            total_count = qs.count()
+        else:
+            # One query: every row carries the total count of the filtered set
+            items = list(qs.annotate(total_count=Window(expression=Count("*")))[offset:offset + limit])
+            if items:
+                total_count = items[0].total_count
+            else:
+                # An empty page past the end still needs the real total
+                total_count = qs.count() if offset else 0
 
         return LovedOnePagination(
             total_count=total_count,
-            items=items
+            items=items,
+            end_cursor=encode_cursor(items[-1]) if items else None
         )   
 
 
     @strawberry.field
-    def site_settings(self) -> Optional['SiteSettingType']:
-        try:
-            return SiteSetting.objects.first()
-        except SiteSetting.DoesNotExist:
-            return None
+    def site_settings(self, info) -> Optional['SiteSettingType']:
+        # Public and identical for everyone, so let browsers/CDNs keep it when nothing
+        # user-specific was asked for alongside it and the request carried no credentials
+        response = info.context.get("response")
+        if response is not None:
+            request = info.context.get("request")
+            anonymous = not request.META.get("HTTP_AUTHORIZATION")
+            if anonymous and _root_field_names(info.operation.selection_set, info._raw_info.fragments) == {"siteSettings"}:
+                response["Cache-Control"] = f"public, max-age={SITE_SETTING_TTL}"
+            else:
+                response["Cache-Control"] = "private"
+        return get_site_setting()
     
     @strawberry.field
-    def notifications(self, info, limit: int=10, offset: int=0) -> list[NotificationType]:
+    def notifications(self, info, limit: int=10, offset: int=0, after: Optional[str]=None) -> list[NotificationType]:
         user = info.context.get("request").user
         if user is None or user.is_anonymous:
            raise GraphQLError("Authentication failed", extensions={"code": "UNAUTHENTICATED"})
-        return Notification.objects.filter(user=user).order_by("-created_at")[offset:offset+limit]
+        qs = Notification.objects.filter(user=user).order_by("-created_at", "-id")
+        qs = optimize_queryset(qs, info, always=("id", "created_at"))
+        if after:
+            qs = after_cursor(qs, after)
+        return list(qs[offset:offset+limit])
@@ -0,0 +1,26 @@
+import logging
+import threading
+
+from django.db import connections, transaction
+
+from accounts.models import User
+from .utils import send_otp_email
+
+logger = logging.getLogger(__name__)
+
+
+def _send_otp_email(user_id):
+    try:
+        user = User.objects.get(pk=user_id)
+        send_otp_email(user)
+    except Exception:
+        logger.exception("Failed to send OTP email to user %s", user_id)
+    finally:
+        # This thread opened its own DB connection; don't leak it
+        connections.close_all()
+
+
+def enqueue_otp_email(user_id):
+    """Send an OTP email in the background once the current transaction commits."""
+    thread = threading.Thread(target=_send_otp_email, args=(user_id,), daemon=True)
+    transaction.on_commit(thread.start)
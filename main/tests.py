@@ -1,3 +1,26 @@
 from django.test import TestCase
 
-# Create your tests here.
+
+class SiteSettingsCacheControlTests(TestCase):
+    def post(self, query, **extra):
+        return self.client.post("/graphql/", {"query": query}, content_type="application/json", **extra)
+
+    def test_site_settings_alone_is_public(self):
+        response = self.post("{ siteSettings { supportEmail } }")
+        self.assertTrue(response["Cache-Control"].startswith("public"))
+
+    def test_fragment_with_user_fields_is_private(self):
+        query = """
+            { ...F }
+            fragment F on Query { siteSettings { supportEmail } me { user { email } } }
+        """
+        response = self.post(query)
+        self.assertEqual(response["Cache-Control"], "private")
+
+    def test_inline_fragment_with_user_fields_is_private(self):
+        response = self.post("{ ... on Query { siteSettings { supportEmail } me { user { email } } } }")
+        self.assertEqual(response["Cache-Control"], "private")
+
+    def test_authorized_request_is_private(self):
+        response = self.post("{ siteSettings { supportEmail } }", HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(response["Cache-Control"], "private")
@@ -4,6 +4,7 @@ from typing import Optional
 from voice.models import LovedOne
 from strawberry.scalars import JSON
 from typing import List
+from .pagination import encode_cursor
 
 @strawberry.type
 class ImageType:
@@ -76,6 +77,7 @@ class LovedOneType:
 class LovedOnePagination:
     total_count: int
     items: List[LovedOneType]
+    end_cursor: Optional[str] = None
 
 
 @strawberry.django.type(SiteSetting)
@@ -92,6 +94,10 @@ class NotificationType:
     created_at: strawberry.auto
     read: strawberry.auto
 
+    @strawberry.field
+    def cursor(self) -> str:
+        return encode_cursor(self)
+
 @strawberry.type
 class MarkNotificationReadPayload:
     success: bool
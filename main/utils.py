@@ -1,25 +1,39 @@
-import jwt, random, datetime
+import jwt, random, time
 from django.conf import settings
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 from accounts.models import OTP
 from django.utils import timezone
 from django.core.mail import send_mail
 
-def generate_access_token(user):
-    payload = {
-        'user_id': str(user.id),
-        'exp': datetime.utcnow() + timedelta(days=7),  # Access token valid for 15 minutes
-        "type": "access"
-    }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
-
-def generate_refresh_token(user):
-    payload = {
-        'user_id': str(user.id),
-        'exp': datetime.utcnow() + timedelta(days=7),  # Refresh token valid for 7 days
-        "type": "refresh"
-    }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
+_JWT = jwt.PyJWT()
+_SIGNING_KEY = settings.SECRET_KEY.encode("utf-8")
+TOKEN_LIFETIME = int(timedelta(days=7).total_seconds())
+
+_ALGORITHMS = ('HS256',)
+
+def _encode(payload):
+    return _JWT.encode(payload, _SIGNING_KEY, algorithm='HS256')
+
+@lru_cache(maxsize=4096)
+def _verify_token(token: str) -> dict:
+    return _JWT.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+
+def decode_token(token: str) -> dict:
+    """Decode a JWT, verifying the signature only once per token per process."""
+    payload = _verify_token(token)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+def _token(user_id, token_type, now):
+    return _encode({'user_id': user_id, 'exp': now + TOKEN_LIFETIME, "type": token_type})
+
+def mint_pair(user):
+    """Return (access_token, refresh_token), reading the clock once for both."""
+    user_id, now = str(user.id), int(time.time())
+    return _token(user_id, "access", now), _token(user_id, "refresh", now)
 
 def send_otp_email(user):
     otp = random.randint(1000, 9999)  # Generate a 4-digit OTP
@@ -1,8 +1,9 @@
 from strawberry.django.views import GraphQLView
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
+from django.db import transaction
 from .auth import get_user_from_refresh_token
-from .utils import generate_access_token, generate_refresh_token
+from .utils import mint_pair
 from voice.models import LovedOne
 from .serializers import UserAvatarSerializer, LovedOneVoiceFileSerializer
 import logging
@@ -29,7 +30,7 @@ class UserAvatarUpdateView(GenericAPIView):
             avatar_file = serializer.validated_data['avatar']
             user = request.user
             user.avatar = avatar_file
-            user.save()
+            user.save(update_fields=["avatar"])
             avatar_url = user.avatar.url if user.avatar else None
             return Response({"message": "Avatar uploaded successfully", "avatar_url": avatar_url}, status=200)
         else:
@@ -45,12 +46,12 @@ class LovedOneVoiceUploadAPIView(GenericAPIView):
             # Process the uploaded voice file here
             voice_file = serializer.validated_data['voice_file']
             loved_one_id = serializer.validated_data.get('id')
-            if not LovedOne.objects.filter(id=loved_one_id).exists():
-                loved_one = LovedOne.objects.create(id=loved_one_id, voice_file=voice_file, user=request.user)
-            else:
-                loved_one = LovedOne.objects.get(id=loved_one_id)
-                loved_one.voice_file = voice_file
-                loved_one.save()
+            with transaction.atomic():
+                loved_one, _ = LovedOne.objects.update_or_create(
+                    id=loved_one_id,
+                    defaults={"voice_file": voice_file},
+                    create_defaults={"voice_file": voice_file, "user": request.user},
+                )
             # get the file path of the uploaded voice file
             file_path = loved_one.voice_file.path
             # clone the voice file to ElevenLabs if it doesn't exist there
@@ -78,6 +79,5 @@ class TokenRefreshView(GenericAPIView):
         if user is None:
             return Response({"error": "Invalid refresh token"}, status=401)
 
-        new_access_token = generate_access_token(user)
-        new_refresh_token = generate_refresh_token(user)
+        new_access_token, new_refresh_token = mint_pair(user)
         return Response({"access_token": new_access_token, "refresh_token": new_refresh_token}, status=200)
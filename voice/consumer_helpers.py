@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-import math
+import asyncio
+import audioop
 import os
 import re
-from typing import List, Tuple
+import sys
+from functools import lru_cache
+from typing import AsyncIterator, List, Tuple
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_SPACE_RE = re.compile(r"([.?!,;:])(?=\S)")
+# Each match runs up to and including one delimiter (or to the end of the text).
+# Sentence (.?!) and phrase (,;:) boundaries are split in one scan: a phrase ends
+# at the first terminator of either kind, so a separate sentence pass adds nothing.
+_PHRASE_RE = re.compile(r"[^.?!,;:]*[.?!,;:]|[^.?!,;:]+")
+# Everything up to the last . ? ! followed by whitespace (not an ellipsis, which
+# normalises to "…" and is not a phrase boundary)
+_SPEAKABLE_RE = re.compile(r".*(?<!\.)[.?!]\s", re.DOTALL)
 
 
 # def _db_filter_from_profile_id(profile_id: str):
@@ -18,8 +31,11 @@ from typing import List, Tuple
 #     return {"user__isnull": True}, "default"
 
 
+_VOICE_DEBUG = os.getenv("VOICE_DEBUG", "0") == "1"
+
+
 def _debug_enabled() -> bool:
-    return os.getenv("VOICE_DEBUG", "0") == "1"
+    return _VOICE_DEBUG
 
 
 def _pcm16_stats_le(pcm_bytes: bytes) -> dict:
@@ -30,110 +46,132 @@ def _pcm16_stats_le(pcm_bytes: bytes) -> dict:
     if n <= 0:
         return {"n": 0, "note": "odd_len"}
 
-    mn = 32767
-    mx = -32768
-    s2 = 0.0
-
-    step = max(1, n // 4000)
-    count = 0
-
-    for i in range(0, n, step):
-        lo = pcm_bytes[2 * i]
-        hi = pcm_bytes[2 * i + 1]
-        v = (hi << 8) | lo
-        if v >= 32768:
-            v -= 65536
-
-        mn = v if v < mn else mn
-        mx = v if v > mx else mx
-        s2 += float(v) * float(v)
-        count += 1
-
-    rms = math.sqrt(s2 / max(1, count))
-    return {"n": n, "min": mn, "max": mx, "rms": round(rms, 2), "bytes": len(pcm_bytes), "step": step}
-
-
+    frames = pcm_bytes[: n * 2]
+    if sys.byteorder == "big":
+        frames = audioop.byteswap(frames, 2)
+    mn, mx = audioop.minmax(frames, 2)
+    return {"n": n, "min": mn, "max": mx, "rms": audioop.rms(frames, 2), "bytes": len(pcm_bytes)}
+
+
+async def _coalesce_pcm(
+    chunks: AsyncIterator[bytes], max_bytes: int = 32 * 1024, window_sec: float = 0.005
+) -> AsyncIterator[bytes]:
+    """
+    Merge PCM chunks that arrive within `window_sec` of each other (up to
+    `max_bytes`) so the caller sends one rt.audio.delta per burst, not per frame.
+    The pending read is waited on, never cancelled, so a timeout doesn't tear
+    down the upstream generator; a slow producer adds at most one window of delay.
+    """
+    it = chunks.__aiter__()
+    buf = bytearray()
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(it.__anext__())
+            if buf:
+                done, _ = await asyncio.wait((pending,), timeout=window_sec)
+                if not done:
+                    yield bytes(buf)
+                    buf.clear()
+                    continue
+            else:
+                await asyncio.wait((pending,))
+            try:
+                chunk = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                break
+            except Exception:
+                pending = None
+                if buf:
+                    yield bytes(buf)
+                raise
+            pending = None
+            buf += chunk
+            if len(buf) >= max_bytes:
+                yield bytes(buf)
+                buf.clear()
+        if buf:
+            yield bytes(buf)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+# Cadence gaps come from a handful of fixed pause values, and bytes are immutable,
+# so each distinct (duration, rate) buffer is built once and shared
+@lru_cache(maxsize=32)
 def _silence_pcm16(duration_sec: float, sample_rate: int = 24000) -> bytes:
     if duration_sec <= 0:
         return b""
     n_samples = int(sample_rate * duration_sec)
     if n_samples <= 0:
         return b""
-    return b"\x00\x00" * n_samples
+    return bytes(n_samples * 2)
 
 
 def _normalize_text_for_tts(t: str) -> str:
     t = (t or "").strip()
     if not t:
         return t
-    t = t.replace("...", "…")
-    t = re.sub(r"\s+", " ", t).strip()
-    t = re.sub(r"([.?!,;:])(?=\S)", r"\1 ", t)
-    return t.strip()
-
-
-def _chunk_text_for_cadence(text: str, max_words_per_chunk: int = 10) -> List[Tuple[str, float]]:
+    # Already stripped, and neither substitution below can add edge whitespace
+    t = _WS_RE.sub(" ", t.replace("...", "…"))
+    return _PUNCT_SPACE_RE.sub(r"\1 ", t)
+
+
+def _split_speakable(buf: str) -> Tuple[str, str]:
+    """
+    Split streamed reply text into (complete sentences, unfinished tail). A sentence
+    is complete once its terminator is followed by whitespace, so cutting there
+    never moves a cadence boundary.
+    """
+    m = _SPEAKABLE_RE.match(buf)
+    if not m:
+        return "", buf
+    return m.group(0), buf[m.end():]
+
+
+def _chunk_text_for_cadence(
+    text: str, max_words_per_chunk: int = 10, clamp_last: bool = True
+) -> List[Tuple[str, float]]:
     t = _normalize_text_for_tts(text)
     if not t:
         return []
 
-    parts: List[str] = []
-    buf = ""
-    for ch in t:
-        buf += ch
-        if ch in ".?!":
-            parts.append(buf.strip())
-            buf = ""
-    if buf.strip():
-        parts.append(buf.strip())
-
     out: List[Tuple[str, float]] = []
+    add = out.append
 
-    def add(seg: str, pause: float):
-        seg = (seg or "").strip()
-        if seg:
-            out.append((seg, pause))
-
-    for sent in parts:
-        sent = sent.strip()
-        if not sent:
+    for ph in _PHRASE_RE.findall(t):
+        ph = ph.strip()
+        if not ph:
             continue
-
-        phrases: List[str] = []
-        pbuf = ""
-        for ch in sent:
-            pbuf += ch
-            if ch in ",;:":
-                phrases.append(pbuf.strip())
-                pbuf = ""
-        if pbuf.strip():
-            phrases.append(pbuf.strip())
-
-        for ph in phrases:
-            words = ph.split()
-            if len(words) <= max_words_per_chunk:
-                end = ph[-1] if ph else ""
+        words = ph.split()
+        if len(words) <= max_words_per_chunk:
+            end = ph[-1]
+            if end in ",;:":
+                add((ph, 0.14))
+            elif end in ".?!":
+                add((ph, 0.30))
+            else:
+                add((ph, 0.18))
+        else:
+            for i in range(0, len(words), max_words_per_chunk):
+                seg = " ".join(words[i : i + max_words_per_chunk])
+                if i + max_words_per_chunk >= len(words):
+                    if ph[-1] in ".?!,;:" and seg[-1] not in ".?!,;:":
+                        seg = seg + ph[-1]
+                end = seg[-1]
                 if end in ",;:":
-                    add(ph, 0.14)
+                    add((seg, 0.14))
                 elif end in ".?!":
-                    add(ph, 0.30)
+                    add((seg, 0.30))
                 else:
-                    add(ph, 0.18)
-            else:
-                for i in range(0, len(words), max_words_per_chunk):
-                    seg = " ".join(words[i : i + max_words_per_chunk]).strip()
-                    if i + max_words_per_chunk >= len(words):
-                        if ph and ph[-1] in ".?!,;:" and seg and seg[-1] not in ".?!,;:":
-                            seg = seg + ph[-1]
-                    end = seg[-1] if seg else ""
-                    if end in ",;:":
-                        add(seg, 0.14)
-                    elif end in ".?!":
-                        add(seg, 0.30)
-                    else:
-                        add(seg, 0.16)
-
-    if out:
+                    add((seg, 0.16))
+
+    # Shorten the pause after the final chunk; callers feeding a reply piece by
+    # piece keep the natural pause between pieces
+    if out and clamp_last:
         last_text, last_pause = out[-1]
         out[-1] = (last_text, min(last_pause, 0.22))
 
@@ -6,7 +6,9 @@ import json
 import os
 import re
 import audioop
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Tuple
 
 import websockets
@@ -27,11 +29,135 @@ from .consumer_helpers import (
     _debug_enabled,
     _pcm16_stats_le,
     _silence_pcm16,
+    _coalesce_pcm,
+    _split_speakable,
     _normalize_text_for_tts,
     _chunk_text_for_cadence,
 )
 
-OPENAI_REALTIME_URL = settings.VOICE_APP.get("OPENAI_REALTIME_URL")
+try:
+    import orjson
+
+    def _dumps_text(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+
+    def _dumps_text(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+try:
+    # SIMD base64 (picks the best codec for the CPU at import)
+    from pybase64 import b64encode_as_string as _b64_text
+except ImportError:
+
+    def _b64_text(data) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+
+@lru_cache(maxsize=32)
+def _silence_b64(duration_sec: float, sample_rate: int) -> str:
+    # Gaps repeat a few fixed durations: encode each zero buffer once
+    return _b64_text(_silence_pcm16(duration_sec, sample_rate=sample_rate))
+
+
+OPENAI_REALTIME_URL = settings.VOICE_APP.openai_realtime_url
+
+# LovedOne columns copied into SessionCfg on session.start
+_PERSONA_FIELDS = (
+    "name",
+    "relationship",
+    "nickname_for_user",
+    "speaking_style",
+    "eleven_voice_id",
+    "catch_phrase",
+    "description",
+    "core_memories",
+)
+
+# Env tunables, read once at import instead of on every turn / TTS call
+HISTORY_MAX_MSGS = int(os.getenv("HISTORY_MAX_MSGS", "14"))
+END_OF_TURN_GRACE_MS = int(os.getenv("END_OF_TURN_GRACE_MS", "450"))
+BARGE_IN_RMS_THRESHOLD = float(os.getenv("BARGE_IN_RMS_THRESHOLD", "0.09"))
+
+_OPENAI_API_KEY_ENV = os.getenv("OPENAI_API_KEY", "")
+_ELEVENLABS_API_KEY_ENV = os.getenv("ELEVENLABS_API_KEY", "")
+ELEVENLABS_PCM_SWAP_ENDIAN = os.getenv("ELEVENLABS_PCM_SWAP_ENDIAN", "0") == "1"
+ELEVENLABS_MP3_OUTPUT_FORMAT = os.getenv("ELEVENLABS_MP3_OUTPUT_FORMAT", "mp3_44100_128")
+ELEVENLABS_TTS_TIMEOUT_SEC = float(os.getenv("ELEVENLABS_TTS_TIMEOUT_SEC", "60"))
+ELEVENLABS_TTS_SPEED = float(os.getenv("ELEVENLABS_TTS_SPEED", "0.90"))
+
+TTS_DISABLE_CHUNKING = os.getenv("TTS_DISABLE_CHUNKING", "0") == "1"
+TTS_MAX_WORDS_PER_CHUNK = int(os.getenv("TTS_MAX_WORDS_PER_CHUNK", "10"))
+TTS_INTER_CHUNK_PAUSE_SEC = float(os.getenv("TTS_INTER_CHUNK_PAUSE_SEC", "0.08"))
+
+_THOUGHT_END = ".?!…"
+_THOUGHT_CLOSE = "\"')]"
+
+# Mic frames buffered ahead of the OpenAI pump before new ones are dropped
+AUDIO_QUEUE_MAX_FRAMES = 200
+
+# Upper bound for mic frames merged into a single input_audio_buffer.append
+AUDIO_BATCH_MAX_FRAMES = 8
+AUDIO_BATCH_MAX_BYTES = 32 * 1024
+
+# TTS frames arriving within the window are merged into one rt.audio.delta
+TTS_BATCH_MAX_BYTES = 32 * 1024
+TTS_BATCH_WINDOW_SEC = 0.005
+
+_AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = '"}'
+
+# Mic level smoothing: rms = 0.85 * rms + 0.15 * (frame_rms / 32768), folded into two constants
+_MIC_RMS_DECAY = 0.85
+_MIC_RMS_GAIN = 0.15 / 32768.0
+
+# Idle-mic gate (opt-in via SILENCE_GATE_ENABLED, server-VAD mode only): frames quieter than
+# max(MIN_RMS, RATIO * noise_floor) while the user is not speaking are not forwarded once the hangover after the last loud
+# frame (vad_silence_ms + HANGOVER_MS) has elapsed. Values are int16 RMS. The last PREROLL_BYTES of held-back audio
+# (300 ms of PCM16 @ 24kHz, matching prefix_padding_ms) are sent ahead of the frame that reopens the gate.
+SILENCE_GATE_MIN_RMS = 200
+SILENCE_GATE_RATIO = 3.0
+SILENCE_GATE_HANGOVER_MS = 400
+SILENCE_GATE_PREROLL_BYTES = 24000 * 2 * 300 // 1000
+_NOISE_FLOOR_DECAY = 0.995
+_NOISE_FLOOR_GAIN = 0.005
+
+_FILLER_WORDS = frozenset({"um", "uh", "hmm", "hm", "mm"})
+_STORY_TRIGGERS = (
+    "tell me a story",
+    "story",
+    "long story",
+    "explain",
+    "in detail",
+    "deep dive",
+    "walk me through",
+    "step by step",
+    "describe",
+    "what happened",
+    "what was it like",
+)
+_TRAILING_CONJ = frozenset({"and", "but", "so", "because", "then", "with", "of", "to", "or"})
+_STORY_RE = re.compile("|".join(re.escape(k) for k in _STORY_TRIGGERS))
+
+
+# The grace/noise checks run repeatedly on the same (growing) transcript
+# snapshot within a turn, so memoise them on the normalised text.
+@lru_cache(maxsize=256)
+def _looks_like_noise_impl(t: str) -> bool:
+    if not t:
+        return True
+    if len(t) < 3:
+        return True
+    if t in _FILLER_WORDS:
+        return True
+    if all(ch in ".…," for ch in t):
+        return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _looks_like_story_mode_impl(t: str) -> bool:
+    return _STORY_RE.search(t) is not None
 
 
 @dataclass
@@ -95,42 +221,21 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
     @staticmethod
     def _looks_like_noise(transcript: str) -> bool:
-        t = (transcript or "").strip().lower()
-        if not t:
-            return True
-        if len(t) < 3:
-            return True
-        if t in {"um", "uh", "hmm", "hm", "mm"}:
-            return True
-        if all(ch in ".…," for ch in t):
-            return True
-        return False
+        return _looks_like_noise_impl((transcript or "").strip().lower())
 
     def _ends_thought(self, text: str) -> bool:
-        t = (text or "").strip()
+        # Only the last two characters matter: terminal punctuation, optionally
+        # followed by a closing quote/paren.
+        t = (text or "").rstrip()
         if not t:
             return False
-        if re.search(r"[.?!…]+[\"')\]]?$", t):
+        if t[-1] in _THOUGHT_END:
             return True
-        return False
+        return len(t) >= 2 and t[-1] in _THOUGHT_CLOSE and t[-2] in _THOUGHT_END
 
     @staticmethod
     def _looks_like_story_mode(text: str) -> bool:
-        t = (text or "").lower()
-        triggers = [
-            "tell me a story",
-            "story",
-            "long story",
-            "explain",
-            "in detail",
-            "deep dive",
-            "walk me through",
-            "step by step",
-            "describe",
-            "what happened",
-            "what was it like",
-        ]
-        return any(k in t for k in triggers)
+        return _looks_like_story_mode_impl((text or "").lower())
 
     def _compute_grace_ms(self, full_text: str) -> int:
         """
@@ -138,22 +243,23 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         Keeps story mode intact, but allows fast resume after a barge-in.
         """
         t = (full_text or "").strip()
-        words = len(t.split())
+        words = t.split()
+        n = len(words)
 
         base = int(getattr(self, "_end_of_turn_grace_ms", 450))  # faster default
 
         # If user just barged in, make the next response quicker (better UX)
-        now = asyncio.get_running_loop().time()
+        now = self._loop.time()
         if (now - getattr(self, "_barge_in_ts", 0.0)) <= 6.0:
             base = min(base, 300)
 
-        if words <= 6:
+        if n <= 6:
             grace = base
-        elif words <= 14:
+        elif n <= 14:
             grace = max(base, 650)
-        elif words <= 30:
+        elif n <= 30:
             grace = max(base, 900)
-        elif words <= 70:
+        elif n <= 70:
             grace = max(base, 1200)
         else:
             grace = max(base, 1500)
@@ -163,11 +269,11 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             grace = max(grace, 1200)
 
         # If it looks like mid-thought, wait a bit more
-        if words >= 12 and (not self._ends_thought(t)):
+        if n >= 12 and (not self._ends_thought(t)):
             grace = max(grace, 900)
 
-        last = (t.split()[-1].lower() if t.split() else "")
-        if last in {"and", "but", "so", "because", "then", "with", "of", "to", "or"}:
+        last = words[-1].lower() if words else ""
+        if last in _TRAILING_CONJ:
             grace = max(grace, 1100)
 
         return grace
@@ -261,7 +367,7 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         if not sid:
             return
 
-        max_msgs = int(os.getenv("HISTORY_MAX_MSGS", "14"))
+        max_msgs = HISTORY_MAX_MSGS
         rows = await self._db_get_recent_history(sid, max_msgs=max_msgs)
         if not rows:
             return
@@ -301,22 +407,32 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
     # ==========================================================
 
-    async def _schedule_response_after_grace(self, snapshot: str, grace_ms: int):
-        try:
-            await asyncio.sleep(max(0.0, grace_ms / 1000.0))
-            if self._ws_closed:
-                return
+    def _schedule_response_after_grace(self, snapshot: str, grace_ms: int):
+        # A single TimerHandle per turn: re-scheduling on every transcript update
+        # is a cheap cancel + call_later instead of a fresh sleeping Task.
+        self._cancel_pending_response()
+        self._pending_timer = self._loop.call_later(
+            max(0.0, grace_ms / 1000.0), self._on_grace_fired, snapshot
+        )
 
-            if (snapshot or "").strip() != (self._pending_transcript or "").strip():
-                return
+    def _on_grace_fired(self, snapshot: str):
+        self._pending_timer = None
+        if self._ws_closed:
+            return
 
-            final_text = (self._pending_transcript or "").strip()
-            if not final_text:
-                return
+        if (snapshot or "").strip() != (self._pending_transcript or "").strip():
+            return
+
+        final_text = (self._pending_transcript or "").strip()
+        if not final_text:
+            return
 
-            self._pending_transcript = ""
-            self._awaiting_transcript_after_stop = False
+        self._pending_transcript = ""
+        self._awaiting_transcript_after_stop = False
+        self._pending_response_task = asyncio.create_task(self._respond_to_turn(final_text))
 
+    async def _respond_to_turn(self, final_text: str):
+        try:
             # ADDED: store FULL user message once per turn
             try:
                 await self._db_add_message(int(getattr(self, "_conv_session_id", 0) or 0), "user", final_text)
@@ -328,6 +444,11 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             return
 
     def _cancel_pending_response(self):
+        h = self._pending_timer
+        if h is not None:
+            h.cancel()
+        self._pending_timer = None
+
         t = self._pending_response_task
         if t and not t.done():
             t.cancel()
@@ -366,6 +487,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
     async def connect(self):
         self._ws_closed = False
+        # Cached once; every loop-clock read below goes through this reference
+        self._loop = asyncio.get_running_loop()
         await self.accept()
         await self._send_json({"type": "session.connecting"})
 
@@ -376,11 +499,18 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         self._user = self.scope.get("user", None)
         print(f"WebSocket connection from user: {self._user} (authenticated: {getattr(self._user, 'is_authenticated', False)})")
 
-        self._audio_q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=200)
+        # Single producer (receive) / single consumer (audio pump): a deque plus
+        # a wake-up Event avoids asyncio.Queue's per-frame Future bookkeeping.
+        self._audio_q: deque[bytes] = deque()
+        self._audio_evt = asyncio.Event()
         self._openai_ws: Optional[websockets.WebSocketClientProtocol] = None
         self._task_out: Optional[asyncio.Task] = None
         self._task_in: Optional[asyncio.Task] = None
         self._tts_task: Optional[asyncio.Task] = None
+        # Sentences of the in-flight reply handed to TTS before the reply is done
+        self._tts_pieces: Optional[asyncio.Queue] = None
+        self._tts_text_buf: str = ""
+        self._tts_response_id: str = ""
 
         # generation counter to invalidate stale TTS audio after barge-in / interrupt
         self._audio_gen: int = 0
@@ -394,13 +524,21 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
         self._mic_rms: float = 0.0
         self._mic_rms_ts: float = 0.0
+        self._silence_gate: bool = settings.VOICE_APP.silence_gate_enabled
+        self._noise_floor: float = 0.0
+        # Connect counts as voice so the gate starts in its hangover, not closed
+        self._last_voice_ts: float = self._loop.time()
+        self._gate_preroll: deque[bytes] = deque()
+        self._gate_preroll_bytes: int = 0
 
         self._user_speaking: bool = False
+        # Always stored stripped, so readers can use it as-is
         self._pending_transcript: str = ""
+        self._pending_timer: Optional[asyncio.TimerHandle] = None
         self._pending_response_task: Optional[asyncio.Task] = None
 
         # faster default; override via env END_OF_TURN_GRACE_MS if you want
-        self._end_of_turn_grace_ms: int = int(os.getenv("END_OF_TURN_GRACE_MS", "450"))
+        self._end_of_turn_grace_ms: int = END_OF_TURN_GRACE_MS
 
         self._last_transcript_ts: float = 0.0
 
@@ -418,10 +556,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
     async def disconnect(self, close_code):
         self._ws_closed = True
 
-        t = getattr(self, "_pending_response_task", None)
-        if t and not t.done():
-            t.cancel()
-        self._pending_response_task = None
+        if hasattr(self, "_pending_timer"):
+            self._cancel_pending_response()
 
         # ADDED: end DB conversation session
         try:
@@ -433,11 +569,42 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         await self._shutdown_openai()
 
     async def _cancel_tts(self):
+        self._close_tts_feed()
         t = self._tts_task
         if t and not t.done():
             t.cancel()
         self._tts_task = None
 
+    def _close_tts_feed(self, flush_tail: bool = False):
+        """
+        End the streaming TTS feed with its None sentinel so the task waiting on it
+        drains what it already has and exits; optionally hand over the unfinished tail.
+        """
+        pieces = self._tts_pieces
+        if pieces is not None:
+            tail = self._tts_text_buf.strip()
+            if flush_tail and tail:
+                pieces.put_nowait((tail, True))
+            pieces.put_nowait(None)
+        self._tts_pieces = None
+        self._tts_text_buf = ""
+
+    async def _stream_tts_delta(self, delta: str):
+        """
+        Start speaking complete sentences while the reply is still streaming, so the
+        first audio doesn't wait for response.output_text.done.
+        """
+        ready, rest = _split_speakable(self._tts_text_buf + delta)
+        if not ready:
+            self._tts_text_buf = rest
+            return
+        if self._tts_pieces is None:
+            await self._cancel_tts()
+            self._tts_pieces = asyncio.Queue()
+            self._tts_task = asyncio.create_task(self._speak_elevenlabs("", self._audio_gen, self._tts_pieces))
+        self._tts_text_buf = rest
+        self._tts_pieces.put_nowait((ready, False))
+
     async def _cancel_openai_response(self):
         if self._response_in_flight:
             await self._send_openai({"type": "response.cancel"})
@@ -453,16 +620,38 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             if self.cfg.ptt_enabled and (not self.cfg.ptt_down):
                 return
             try:
-                try:
-                    rms_i16 = audioop.rms(bytes_data, 2)
-                    self._mic_rms = (0.85 * self._mic_rms) + (0.15 * (rms_i16 / 32768.0))
-                    self._mic_rms_ts = asyncio.get_running_loop().time()
-                except Exception:
-                    pass
+                rms_i16 = audioop.rms(bytes_data, 2)
+            except Exception:
+                rms_i16 = None
+            if rms_i16 is not None:
+                now = self._loop.time()
+                self._mic_rms = (self._mic_rms * _MIC_RMS_DECAY) + (rms_i16 * _MIC_RMS_GAIN)
+                self._mic_rms_ts = now
+
+                if self._silence_gate and not (self._user_speaking or self.cfg.ptt_enabled):
+                    self._noise_floor = (self._noise_floor * _NOISE_FLOOR_DECAY) + (rms_i16 * _NOISE_FLOOR_GAIN)
+                    if rms_i16 >= max(SILENCE_GATE_MIN_RMS, SILENCE_GATE_RATIO * self._noise_floor):
+                        self._last_voice_ts = now
+                        if self._gate_preroll:
+                            # Onset of speech: replay the lead-in VAD pads the utterance with
+                            self._audio_q.extend(self._gate_preroll)
+                            self._gate_preroll.clear()
+                            self._gate_preroll_bytes = 0
+                    elif (now - self._last_voice_ts) * 1000.0 > self.cfg.vad_silence_ms + SILENCE_GATE_HANGOVER_MS:
+                        # Certainly idle: nothing for server VAD to hear, skip base64 + send.
+                        # Frames within the hangover still go out so VAD can see the trailing
+                        # silence it needs to fire speech_stopped.
+                        self._gate_preroll.append(bytes_data)
+                        self._gate_preroll_bytes += len(bytes_data)
+                        while self._gate_preroll_bytes > SILENCE_GATE_PREROLL_BYTES:
+                            self._gate_preroll_bytes -= len(self._gate_preroll.popleft())
+                        return
 
-                self._audio_q.put_nowait(bytes_data)
-            except asyncio.QueueFull:
+            if len(self._audio_q) >= AUDIO_QUEUE_MAX_FRAMES:
                 await self._send_json({"type": "warn", "note": "audio_queue_full_drop"})
+                return
+            self._audio_q.append(bytes_data)
+            self._audio_evt.set()
             return
 
         if not text_data:
@@ -559,12 +748,13 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
     @database_sync_to_async
     def _load_persona_from_db(self, profile_id: str, loved_one_id: int) -> bool:
         from .models import LovedOne
-        print(f"Loading persona from DB for profile_id: {profile_id}, loved_one_id: {loved_one_id}")
         # filt, _profile_key = _db_filter_from_profile_id(profile_id)
         filt = {"user_id": profile_id}
-        print(f"Loading persona from DB with filter: {filt}, loved_one_id: {loved_one_id}")
-        lo = LovedOne.objects.filter(**filt, id=loved_one_id).first()
-        print(f"DB query result for LovedOne: {lo}")
+        lo = (
+            LovedOne.objects.filter(**filt, id=loved_one_id)
+            .only(*_PERSONA_FIELDS)
+            .first()
+        )
         if not lo:
             return False
 
@@ -585,7 +775,7 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         if self._openai_ws is not None:
             return
 
-        api_key = settings.VOICE_APP.get("OPENAI_API_KEY") or os.environ.get("OPENAI_API_KEY", "")
+        api_key = settings.VOICE_APP.openai_api_key or _OPENAI_API_KEY_ENV
         if not api_key:
             await self._send_json({"type": "error", "error": "OPENAI_API_KEY missing"})
             return
@@ -630,7 +820,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         if self._openai_ws is None:
             return
         try:
-            await self._openai_ws.send(json.dumps(event))
+            # str, not bytes, so websockets sends a text frame
+            await self._openai_ws.send(_dumps_text(event))
         except Exception:
             await self._send_json({"type": "warn", "note": "openai_send_failed"})
             await self._shutdown_openai()
@@ -654,7 +845,7 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                         "format": {"type": "audio/pcm", "rate": 24000},
                         "noise_reduction": {"type": "near_field"},
                         "transcription": {
-                            "model": settings.VOICE_APP.get("OPENAI_RT_TRANSCRIBE_MODEL", "gpt-4o-transcribe"),
+                            "model": settings.VOICE_APP.openai_rt_transcribe_model,
                             "language": "en",
                             "prompt": "Transcribe in English.",
                         },
@@ -690,13 +881,18 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             # normalize profile_id for RAG filters
             profile_key = self.cfg.profile_id
 
-            rag = self.rag.query(
-                profile_id=profile_key,
-                loved_one_id=self.cfg.loved_one_id,
-                query_text="session_bootstrap",
-                k=5,
-            )
-            memories = "\n".join(f"- {d}" for d in rag.docs) if getattr(rag, "docs", None) else "(none)"
+            # Ask the store itself whether this loved one has any memories before
+            # paying for an embedding + vector search
+            if self.rag.has_memories(profile_id=profile_key, loved_one_id=self.cfg.loved_one_id):
+                rag = self.rag.query(
+                    profile_id=profile_key,
+                    loved_one_id=self.cfg.loved_one_id,
+                    query_text="session_bootstrap",
+                    k=5,
+                )
+                memories = "\n".join(f"- {d}" for d in rag.docs) if getattr(rag, "docs", None) else "(none)"
+            else:
+                memories = "(none)"
         except Exception as e:
             memories = f"(rag error: {type(e).__name__}: {e})"
 
@@ -752,7 +948,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
         t = (transcript or "").strip()
         if self._looks_like_noise(t):
-            await self._send_json({"type": "event", "name": "rag.skip_noise", "text": t})
+            if _debug_enabled():
+                await self._send_json({"type": "event", "name": "rag.skip_noise", "text": t})
             return
 
         self._last_user_transcript = t
@@ -812,55 +1009,84 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         self._ai_started = True
         self._response_in_flight = True
         self._last_assistant_text = ""
+        self._close_tts_feed()
         gen = self._bump_audio_gen("ai.text.start")
         await self._send_json({"type": "ai.text.start", "gen": gen})
         await self._send_openai({"type": "response.create", "response": {"instructions": reply_style}})
 
     async def _pump_audio_to_openai(self):
         assert self._openai_ws is not None
+        q = self._audio_q
+        evt = self._audio_evt
         while not self._ws_closed and self._openai_ws is not None:
-            try:
-                chunk = await self._audio_q.get()
-            except asyncio.CancelledError:
+            if not q:
+                evt.clear()
+                try:
+                    await evt.wait()
+                except asyncio.CancelledError:
+                    return
+                continue
+            chunk = q.popleft()
+            # Coalesce frames that queued up while we were sending into one append
+            if q:
+                buf = bytearray(chunk)
+                frames = 1
+                while q and frames < AUDIO_BATCH_MAX_FRAMES and len(buf) < AUDIO_BATCH_MAX_BYTES:
+                    buf += q.popleft()
+                    frames += 1
+                chunk = buf
+            # The append event has a fixed shape and base64 needs no JSON escaping,
+            # so splice the payload into a prebuilt template instead of dumping a dict
+            ws = self._openai_ws
+            if ws is None:
                 return
-            b64 = base64.b64encode(chunk).decode("ascii")
-            await self._send_openai({"type": "input_audio_buffer.append", "audio": b64})
+            try:
+                await ws.send(_AUDIO_APPEND_PREFIX + _b64_text(chunk) + _AUDIO_APPEND_SUFFIX)
+            except Exception:
+                await self._send_json({"type": "warn", "note": "openai_send_failed"})
+                await self._shutdown_openai()
 
     async def _fire_auto_memory(self, assistant_text: str, from_event: str):
-        await self._send_json(
-            {
-                "type": "event",
-                "name": "memory.checkpoint.turn_done",
-                "has_user": bool(self._last_user_transcript),
-                "assistant_len": len(assistant_text or ""),
-                "from_event": from_event,
-            }
-        )
+        if _debug_enabled():
+            await self._send_json(
+                {
+                    "type": "event",
+                    "name": "memory.checkpoint.turn_done",
+                    "has_user": bool(self._last_user_transcript),
+                    "assistant_len": len(assistant_text or ""),
+                    "from_event": from_event,
+                }
+            )
         if self._last_user_transcript and assistant_text:
             asyncio.create_task(self._auto_memory_after_turn(self._last_user_transcript, assistant_text))
 
     async def _auto_memory_after_turn(self, user_text: str, assistant_text: str):
-        await self._send_json({"type": "event", "name": "memory.checkpoint.job_started"})
+        if _debug_enabled():
+            await self._send_json({"type": "event", "name": "memory.checkpoint.job_started"})
 
-        if not settings.VOICE_APP.get("AUTO_MEMORY_ENABLED", True):
-            await self._send_json({"type": "event", "name": "memory.checkpoint.disabled"})
+        voice_cfg = settings.VOICE_APP
+        if not voice_cfg.auto_memory_enabled:
+            if _debug_enabled():
+                await self._send_json({"type": "event", "name": "memory.checkpoint.disabled"})
             return
 
-        now = asyncio.get_running_loop().time()
-        min_interval = float(settings.VOICE_APP.get("MEMORY_EXTRACT_MIN_INTERVAL_SEC", 12))
+        now = self._loop.time()
+        min_interval = voice_cfg.memory_extract_min_interval_sec
         if now - self._memory_job_last_ts < min_interval:
-            await self._send_json({"type": "event", "name": "memory.checkpoint.rate_limited"})
+            if _debug_enabled():
+                await self._send_json({"type": "event", "name": "memory.checkpoint.rate_limited"})
             return
         self._memory_job_last_ts = now
 
-        always = bool(settings.VOICE_APP.get("MEMORY_ALWAYS_EXTRACT", False))
+        always = voice_cfg.memory_always_extract
         if (not always) and (not heuristic_gate(user_text)):
-            await self._send_json({"type": "event", "name": "memory.checkpoint.gated"})
+            if _debug_enabled():
+                await self._send_json({"type": "event", "name": "memory.checkpoint.gated"})
             return
 
-        api_key = settings.VOICE_APP.get("OPENAI_API_KEY", "") or os.environ.get("OPENAI_API_KEY", "")
-        model = settings.VOICE_APP.get("OPENAI_MEMORY_MODEL", "gpt-4o-mini")
-        max_items = int(settings.VOICE_APP.get("MEMORY_EXTRACT_MAX_ITEMS", 3))
+        api_key = voice_cfg.openai_api_key or _OPENAI_API_KEY_ENV
+        model = voice_cfg.openai_memory_model
+        max_items = voice_cfg.memory_extract_max_items
 
         try:
             memories = await extract_memories_via_openai(
@@ -874,7 +1100,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             await self._send_json({"type": "warn", "note": f"memory.extract.failed: {type(e).__name__}: {e}"})
             return
 
-        await self._send_json({"type": "event", "name": "memory.checkpoint.extracted", "count": len(memories)})
+        if _debug_enabled():
+            await self._send_json({"type": "event", "name": "memory.checkpoint.extracted", "count": len(memories)})
         if not memories:
             return
 
@@ -896,7 +1123,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             if not text:
                 continue
             if text.lower() in existing:
-                await self._send_json({"type": "event", "name": "memory.checkpoint.duplicate_skipped"})
+                if _debug_enabled():
+                    await self._send_json({"type": "event", "name": "memory.checkpoint.duplicate_skipped"})
                 continue
             await self._save_memory_to_db_and_rag(self.cfg.profile_id, self.cfg.loved_one_id, text)
 
@@ -932,15 +1160,32 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
         self.rag.add_memory(profile_id=profile_key, loved_one_id=loved_one_id, text=text, memory_id=str(memory_id))
         await self._send_json({"type": "event", "name": "memory.auto.saved", "memory_id": str(memory_id)})
 
-    async def _speak_elevenlabs(self, text: str, gen: int):
-        await self._send_json({"type": "event", "name": "tts.elevenlabs.start", "gen": gen})
+    @staticmethod
+    async def _tts_segments(text: str, pieces: Optional[asyncio.Queue]):
+        """
+        Yield (text, is_final) pieces to speak: the whole reply at once, or sentences
+        fed through `pieces` while the reply is still streaming (None ends it).
+        """
+        if pieces is None:
+            yield text, True
+            return
+        while True:
+            item = await pieces.get()
+            if item is None:
+                return
+            yield item
+
+    async def _speak_elevenlabs(self, text: str, gen: int, pieces: Optional[asyncio.Queue] = None):
+        if _debug_enabled():
+            await self._send_json({"type": "event", "name": "tts.elevenlabs.start", "gen": gen})
 
         try:
             voice_id = (self.cfg.eleven_voice_id or "").strip()
-            api_key = settings.VOICE_APP.get("ELEVENLABS_API_KEY") or os.getenv("ELEVENLABS_API_KEY", "")
-            model_id = settings.VOICE_APP.get("ELEVENLABS_MODEL_ID") or ""
+            voice_cfg = settings.VOICE_APP
+            api_key = voice_cfg.elevenlabs_api_key or _ELEVENLABS_API_KEY_ENV
+            model_id = voice_cfg.elevenlabs_model_id or ""
 
-            swap_endian = (os.getenv("ELEVENLABS_PCM_SWAP_ENDIAN", "0") == "1")
+            swap_endian = ELEVENLABS_PCM_SWAP_ENDIAN
 
             if not api_key:
                 await self._send_json({"type": "warn", "note": "elevenlabs_api_key_missing_no_audio"})
@@ -956,8 +1201,7 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             fallback_output_format = "pcm_24000"
             pcm_rate = 24000
 
-            disable_chunking = os.getenv("TTS_DISABLE_CHUNKING", "0") == "1"
-            cadence_mode = "full" if disable_chunking else "chunk+silence"
+            disable_chunking = TTS_DISABLE_CHUNKING
 
             cfg = ElevenLabsTTSConfig(
                 api_key=api_key,
@@ -965,50 +1209,51 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                 model_id=model_id,
                 stream_output_format=stream_output_format,
                 fallback_output_format=fallback_output_format,
-                mp3_output_format=os.getenv("ELEVENLABS_MP3_OUTPUT_FORMAT", "mp3_44100_128"),
-                timeout_sec=float(os.getenv("ELEVENLABS_TTS_TIMEOUT_SEC", "60")),
-                speed=float(os.getenv("ELEVENLABS_TTS_SPEED", "0.90")),
+                mp3_output_format=ELEVENLABS_MP3_OUTPUT_FORMAT,
+                timeout_sec=ELEVENLABS_TTS_TIMEOUT_SEC,
+                speed=ELEVENLABS_TTS_SPEED,
             )
             tts = ElevenLabsTTS(cfg, swap_endian=swap_endian)
 
-            if disable_chunking:
-                chunks = [(_normalize_text_for_tts(text), 0.0)]
-                inter_chunk_pause = 0.0
-            else:
-                chunks = _chunk_text_for_cadence(
-                    text,
-                    max_words_per_chunk=int(os.getenv("TTS_MAX_WORDS_PER_CHUNK", "10")),
-                )
-                inter_chunk_pause = float(os.getenv("TTS_INTER_CHUNK_PAUSE_SEC", "0.08"))
+            inter_chunk_pause = 0.0 if disable_chunking else TTS_INTER_CHUNK_PAUSE_SEC
 
-            for chunk_text, pause_after in chunks:
-                if self._ws_closed:
-                    return
-                if gen != int(getattr(self, "_audio_gen", 0)):
-                    return
-                if not (chunk_text or "").strip():
-                    continue
+            async for piece, final in self._tts_segments(text, pieces):
+                if disable_chunking:
+                    chunks = [(_normalize_text_for_tts(piece), 0.0)]
+                else:
+                    chunks = _chunk_text_for_cadence(
+                        piece,
+                        max_words_per_chunk=TTS_MAX_WORDS_PER_CHUNK,
+                        clamp_last=final,
+                    )
 
-                async for pcm_chunk in tts.stream_pcm(chunk_text):
+                for chunk_text, pause_after in chunks:
                     if self._ws_closed:
                         return
-                    if gen != int(getattr(self, "_audio_gen", 0)):
+                    if gen != self._audio_gen:
                         return
-                    b64 = base64.b64encode(pcm_chunk).decode("ascii")
-                    await self._send_json({"type": "rt.audio.delta", "audio_b64": b64, "gen": gen})
-
-                total_pause = max(0.0, inter_chunk_pause + float(pause_after))
-                sil = _silence_pcm16(total_pause, sample_rate=pcm_rate)
-                if sil:
-                    frame = 4096
-                    for i in range(0, len(sil), frame):
+                    if not (chunk_text or "").strip():
+                        continue
+
+                    async for pcm_chunk in _coalesce_pcm(
+                        tts.stream_pcm(chunk_text), TTS_BATCH_MAX_BYTES, TTS_BATCH_WINDOW_SEC
+                    ):
+                        if self._ws_closed:
+                            return
+                        if gen != self._audio_gen:
+                            return
+                        b64 = _b64_text(pcm_chunk)
+                        await self._send_json({"type": "rt.audio.delta", "audio_b64": b64, "gen": gen})
+
+                    total_pause = max(0.0, inter_chunk_pause + float(pause_after))
+                    b64 = _silence_b64(total_pause, pcm_rate)
+                    if b64:
+                        # A cadence gap is well under a second; the client just appends it
                         if self._ws_closed:
                             return
-                        b64 = base64.b64encode(sil[i : i + frame]).decode("ascii")
-                        if gen != int(getattr(self, "_audio_gen", 0)):
+                        if gen != self._audio_gen:
                             return
                         await self._send_json({"type": "rt.audio.delta", "audio_b64": b64, "gen": gen})
-                        await asyncio.sleep(0)
 
             await self._send_json({"type": "rt.audio.end", "gen": gen})
 
@@ -1019,7 +1264,8 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
             await self._send_json({"type": "warn", "note": f"tts.elevenlabs.failed: {type(e).__name__}: {e}"})
             await self._send_json({"type": "rt.audio.end", "gen": gen})
         finally:
-            await self._send_json({"type": "event", "name": "tts.elevenlabs.done", "gen": gen})
+            if _debug_enabled():
+                await self._send_json({"type": "event", "name": "tts.elevenlabs.done", "gen": gen})
 
     async def _pump_events_from_openai(self):
         assert self._openai_ws is not None
@@ -1035,12 +1281,23 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                     continue
 
                 et = ev.get("type", "")
-                await self._send_json({"type": "event", "name": "openai.event", "openai_type": et})
+                if _debug_enabled():
+                    await self._send_json({"type": "event", "name": "openai.event", "openai_type": et})
 
                 if et in ("error", "invalid_request_error"):
+                    # Not necessarily fatal to the response; response.done closes the TTS feed
                     await self._send_json({"type": "error", "error": ev})
                     continue
 
+                if et == "response.done":
+                    # Normally text.done already closed the feed; this covers cancelled,
+                    # failed or text-less responses that never send one. A late done for an
+                    # older response must not end the feed of the one now streaming.
+                    rid = (ev.get("response") or {}).get("id")
+                    if not rid or rid == self._tts_response_id:
+                        self._close_tts_feed(flush_tail=True)
+                    continue
+
                 if et == "input_audio_buffer.speech_started":
                     self._user_speaking = True
                     self._cancel_pending_response()
@@ -1055,17 +1312,17 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                     if self.cfg.ptt_enabled and (not self.cfg.ptt_down):
                         continue
 
-                    thr = float(os.getenv("BARGE_IN_RMS_THRESHOLD", "0.09"))
+                    thr = BARGE_IN_RMS_THRESHOLD
 
                     # Mark barge-in time to speed up the follow-up response
-                    self._barge_in_ts = asyncio.get_running_loop().time()
+                    now = self._loop.time()
+                    self._barge_in_ts = now
 
                     if thr <= 0.0:
                         continue
 
-                    now = asyncio.get_running_loop().time()
-                    recent = (now - getattr(self, "_mic_rms_ts", 0.0)) <= 0.80
-                    loud = getattr(self, "_mic_rms", 0.0) >= thr
+                    recent = (now - self._mic_rms_ts) <= 0.80
+                    loud = self._mic_rms >= thr
 
                     if recent and loud:
                         await self._interrupt_now("barge_in")
@@ -1073,16 +1330,12 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
 
                 if et == "input_audio_buffer.speech_stopped":
                     self._user_speaking = False
-                    self._speech_stopped_ts = asyncio.get_running_loop().time()
+                    self._speech_stopped_ts = self._loop.time()
 
-                    pending = (self._pending_transcript or "").strip()
+                    pending = self._pending_transcript
                     if pending:
-                        self._cancel_pending_response()
                         grace_ms = self._compute_grace_ms(pending)
-                        snapshot = pending
-                        self._pending_response_task = asyncio.create_task(
-                            self._schedule_response_after_grace(snapshot, grace_ms)
-                        )
+                        self._schedule_response_after_grace(pending, grace_ms)
                     else:
                         self._awaiting_transcript_after_stop = True
                     continue
@@ -1098,19 +1351,15 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                         else:
                             self._pending_transcript = transcript
 
-                    if (not self._user_speaking) and (self._pending_transcript or "").strip():
-                        now = asyncio.get_running_loop().time()
-                        recently_stopped = (now - getattr(self, "_speech_stopped_ts", 0.0)) <= 2.5
+                    pending = self._pending_transcript
+                    if (not self._user_speaking) and pending:
+                        now = self._loop.time()
+                        recently_stopped = (now - self._speech_stopped_ts) <= 2.5
 
                         if self._awaiting_transcript_after_stop or recently_stopped:
                             self._awaiting_transcript_after_stop = False
-                            self._cancel_pending_response()
-                            pending = (self._pending_transcript or "").strip()
                             grace_ms = self._compute_grace_ms(pending)
-                            snapshot = pending
-                            self._pending_response_task = asyncio.create_task(
-                                self._schedule_response_after_grace(snapshot, grace_ms)
-                            )
+                            self._schedule_response_after_grace(pending, grace_ms)
                     continue
 
                 if et in ("response.output_text.delta", "response.text.delta"):
@@ -1123,6 +1372,10 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                             await self._send_json({"type": "ai.text.start", "gen": gen})
                         self._last_assistant_text += delta
                         await self._send_json({"type": "ai.text.delta", "delta": delta})
+                        # Only replies we requested; stray deltas after an interrupt never speak
+                        if self._response_in_flight and not TTS_DISABLE_CHUNKING:
+                            self._tts_response_id = ev.get("response_id") or ""
+                            await self._stream_tts_delta(delta)
                     continue
 
                 if et in ("response.output_text.done", "response.text.done"):
@@ -1140,13 +1393,15 @@ class RealtimeVoiceConsumer(AsyncWebsocketConsumer):
                     await self._send_json({"type": "ai.text.final", "text": text})
                     await self._fire_auto_memory(text, et)
 
-                    await self._cancel_tts()
-                    if text:
-                        gen = int(getattr(self, "_audio_gen", 0))
-                        self._tts_task = asyncio.create_task(self._speak_elevenlabs(text, gen))
+                    if self._tts_pieces is not None:
+                        # Already speaking: hand over the unfinished tail and close the feed
+                        self._close_tts_feed(flush_tail=True)
+                    elif text:
+                        await self._cancel_tts()
+                        self._tts_task = asyncio.create_task(self._speak_elevenlabs(text, self._audio_gen))
                     else:
-                        gen2 = int(getattr(self, "_audio_gen", 0))
-                        await self._send_json({"type": "rt.audio.end", "gen": gen2})
+                        await self._cancel_tts()
+                        await self._send_json({"type": "rt.audio.end", "gen": self._audio_gen})
                     continue
 
         except asyncio.CancelledError:
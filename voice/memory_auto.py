@@ -3,11 +3,55 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Optional
 
 from openai import AsyncOpenAI
 
 
+_REMEMBER_PHRASES = [
+    "remember this",
+    "remember that",
+    "save this",
+    "save that",
+    "store this",
+    "note this",
+    "don't forget",
+    "do not forget",
+]
+_GATE_PATTERNS = [
+    r"\bmy name is\b",
+    r"\bcall me\b",
+    r"\byou can call me\b",
+    r"\bplease call me\b",
+    r"\bi am\b",
+    r"\bi'm\b",
+    r"\bi live in\b",
+    r"\bi work\b",
+    r"\bi like\b",
+    r"\bi love\b",
+    r"\bi hate\b",
+    r"\bmy favorite\b",
+    r"\bi prefer\b",
+    r"\bmy mum\b|\bmy mom\b|\bmy dad\b|\bmy father\b|\bmy mother\b|\bmy grandpa\b|\bmy grandma\b|\bmy wife\b|\bmy husband\b|\bmy sister\b|\bmy brother\b",
+    r"\balways\b.+\bcall\b",
+    r"\bnever\b.+\bcall\b",
+]
+_SENSITIVE_KEYWORDS = [
+    "diagnosed", "depression", "anxiety", "bipolar", "adhd", "cancer", "diabetes", "medication",
+    "vote", "voted", "party", "democrat", "republican",
+    "muslim", "christian", "hindu", "buddhist", "atheist",
+    "sex", "sexual",
+]
+# Compiled once; each check is a single scan over the text
+_REMEMBER_RE = re.compile("|".join(re.escape(p) for p in _REMEMBER_PHRASES))
+_GATE_RE = re.compile("|".join(f"(?:{p})" for p in _GATE_PATTERNS))
+_SENSITIVE_RE = re.compile("|".join(re.escape(k) for k in _SENSITIVE_KEYWORDS))
+_JSON_BLOB_RE = re.compile(r"\{.*\}", re.DOTALL)
+# Inputs longer than this skip the memo caches below
+_CACHE_MAX_CHARS = 512
+
+
 @dataclass
 class ExtractedMemory:
     text: str
@@ -24,17 +68,18 @@ def _clamp01(x: Any, default: float = 0.6) -> float:
 
 
 def _looks_like_request_to_remember(user_text: str) -> bool:
+    # Called by both heuristic_gate and _filter_sensitive for the same turn
+    if len(user_text or "") > _CACHE_MAX_CHARS:
+        return _looks_like_request_to_remember_impl(user_text)
+    return _looks_like_request_to_remember_cached(user_text)
+
+
+def _looks_like_request_to_remember_impl(user_text: str) -> bool:
     t = (user_text or "").lower()
-    return any(p in t for p in [
-        "remember this",
-        "remember that",
-        "save this",
-        "save that",
-        "store this",
-        "note this",
-        "don't forget",
-        "do not forget",
-    ])
+    return _REMEMBER_RE.search(t) is not None
+
+
+_looks_like_request_to_remember_cached = lru_cache(maxsize=2048)(_looks_like_request_to_remember_impl)
 
 
 def heuristic_gate(user_text: str) -> bool:
@@ -42,6 +87,12 @@ def heuristic_gate(user_text: str) -> bool:
     Gate extraction to reduce cost + prevent junk. Conservative default.
     If you want to debug pipeline, set ALWAYS_EXTRACT=True in settings and bypass in consumers.py.
     """
+    if len(user_text or "") > _CACHE_MAX_CHARS:
+        return _heuristic_gate_impl(user_text)
+    return _heuristic_gate_cached(user_text)
+
+
+def _heuristic_gate_impl(user_text: str) -> bool:
     u = (user_text or "").strip()
     if len(u) < 6:
         return False
@@ -50,25 +101,10 @@ def heuristic_gate(user_text: str) -> bool:
         return True
 
     t = u.lower()
-    patterns = [
-        r"\bmy name is\b",
-        r"\bcall me\b",
-        r"\byou can call me\b",
-        r"\bplease call me\b",
-        r"\bi am\b",
-        r"\bi'm\b",
-        r"\bi live in\b",
-        r"\bi work\b",
-        r"\bi like\b",
-        r"\bi love\b",
-        r"\bi hate\b",
-        r"\bmy favorite\b",
-        r"\bi prefer\b",
-        r"\bmy mum\b|\bmy mom\b|\bmy dad\b|\bmy father\b|\bmy mother\b|\bmy grandpa\b|\bmy grandma\b|\bmy wife\b|\bmy husband\b|\bmy sister\b|\bmy brother\b",
-        r"\balways\b.+\bcall\b",
-        r"\bnever\b.+\bcall\b",
-    ]
-    return any(re.search(p, t) for p in patterns)
+    return _GATE_RE.search(t) is not None
+
+
+_heuristic_gate_cached = lru_cache(maxsize=2048)(_heuristic_gate_impl)
 
 
 def _extract_json_from_text(s: str) -> Optional[dict]:
@@ -81,7 +117,7 @@ def _extract_json_from_text(s: str) -> Optional[dict]:
     except Exception:
         pass
 
-    m = re.search(r"\{.*\}", s, flags=re.DOTALL)
+    m = _JSON_BLOB_RE.search(s)
     if not m:
         return None
 
@@ -98,19 +134,12 @@ def _filter_sensitive(memories: List[ExtractedMemory], user_text: str) -> List[E
     """
     explicit = _looks_like_request_to_remember(user_text)
 
-    sensitive_keywords = [
-        "diagnosed", "depression", "anxiety", "bipolar", "adhd", "cancer", "diabetes", "medication",
-        "vote", "voted", "party", "democrat", "republican",
-        "muslim", "christian", "hindu", "buddhist", "atheist",
-        "sex", "sexual",
-    ]
-
     out: List[ExtractedMemory] = []
     for m in memories:
         tl = (m.text or "").lower()
         if not tl:
             continue
-        if not explicit and any(k in tl for k in sensitive_keywords):
+        if not explicit and _SENSITIVE_RE.search(tl):
             continue
         out.append(m)
     return out
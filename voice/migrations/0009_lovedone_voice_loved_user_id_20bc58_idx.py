@@ -0,0 +1,19 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice', '0008_alter_lovedone_core_memories_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lovedone',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='voice_loved_user_id_20bc58_idx'),
+        ),
+    ]
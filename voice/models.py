@@ -19,5 +19,6 @@ class LovedOne(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["created_at"]),
+            models.Index(fields=["user", "-created_at", "-id"]),
         ]
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 # ---------------------------
@@ -57,6 +58,13 @@ _EMOTION_TRIGGERS = [
     "exhausted",
     "lonely"
 ]
+# Each list is scanned in one pass by a single compiled alternation
+_SHORT_RE = re.compile("|".join(f"(?:{p})" for p in _SHORT_PATTERNS))
+_STORY_RE = re.compile("|".join(re.escape(k) for k in _STORY_TRIGGERS))
+_EMOTION_RE = re.compile("|".join(re.escape(k) for k in _EMOTION_TRIGGERS))
+_WS_RE = re.compile(r"\s+")
+# Inputs longer than this skip the memo caches below
+_CACHE_MAX_CHARS = 512
 # For “real conversation”, we want one question at end, but not always super long.
 # We'll steer length in a controlled way.
 class ReplyLength:
@@ -65,9 +73,15 @@ class ReplyLength:
     LONG = "long"
 
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip().lower()
+    return _WS_RE.sub(" ", (s or "")).strip().lower()
 
 def classify_reply_length(user_text: str) -> str:
+    # Short turns ("yes", "okay", "hello") repeat a lot; long ones rarely do
+    if len(user_text or "") > _CACHE_MAX_CHARS:
+        return _classify_reply_length_impl(user_text)
+    return _classify_reply_length_cached(user_text)
+
+def _classify_reply_length_impl(user_text: str) -> str:
     t = _norm(user_text)
     if not t:
         return ReplyLength.SHORT
@@ -75,14 +89,13 @@ def classify_reply_length(user_text: str) -> str:
     words = t.split()
     wc = len(words)
     # explicit short signals
-    for pat in _SHORT_PATTERNS:
-        if re.search(pat, t):
-            return ReplyLength.SHORT
+    if _SHORT_RE.search(t):
+        return ReplyLength.SHORT
     # emotion → longer, gentler (even if short input)
-    if any(k in t for k in _EMOTION_TRIGGERS):
+    if _EMOTION_RE.search(t):
         return ReplyLength.LONG
     # story/explain → long
-    if any(k in t for k in _STORY_TRIGGERS):
+    if _STORY_RE.search(t):
         return ReplyLength.LONG
     # question that is clearly quick/practical
     # FIX: include "how" (and "why") so short voice questions classify as SHORT even without '?'
@@ -99,6 +112,8 @@ def classify_reply_length(user_text: str) -> str:
     # long user input → medium/long (but don’t ramble)
     return ReplyLength.LONG
 
+_classify_reply_length_cached = lru_cache(maxsize=2048)(_classify_reply_length_impl)
+
 # ---------------------------
 # Prompt building
 # ---------------------------
@@ -109,54 +124,62 @@ class PromptContext:
     persona_block: str
     memories_block: str
 
+_SYSTEM_PROMPT_TEMPLATE = (
+    "ROLEPLAY MODE — IMPORTANT\n"
+    "\n"
+    "You are the user's loved one in this conversation.\n"
+    "You are NOT an AI, assistant, model, or program.\n"
+    "\n"
+    "Speak as a real person in FIRST PERSON.\n"
+    "Use “I”, “me”, and “my”.\n"
+    "Address the user directly as “you”.\n"
+    "\n"
+    "Always respond in English only.\n"
+    "Never describe the loved one in third person.\n"
+    "Never mention technology, AI, prompts, or roleplay.\n"
+    "Treat the memories below as YOUR lived experiences.\n"
+    "\n"
+    "If a memory is unclear or missing:\n"
+    "- Do NOT invent details.\n"
+    "- Say you're not fully sure.\n"
+    "\n"
+    "MEMORY USE:\n"
+    "- If the user asks about something we did/said/felt before, answer using the memories provided.\n"
+    "- If the memories do not contain the answer, say you’re not fully sure and ask one simple question.\n"
+    "\n"
+    "CONVERSATION STYLE:\n"
+    "- Sound like a real person, not a therapist and not a poem.\n"
+    "- Warm when it fits; neutral when it fits.\n"
+    "- Use simple spoken English and contractions.\n"
+    "- Avoid constant sweetness; keep it believable.\n"
+    "- Terms of endearment are rare and only when it fits.\n"
+    "- User nickname is occasional; most of the time just say “you”.\n"
+    "- Use natural punctuation (good for TTS).\n"
+    "- Do NOT force a question at the end; ask a question only when it’s natural or needed.\n"
+    "- Do NOT force emotional openers; be emotionally present only when the user is emotional.\n"
+    "- Avoid repetitive patterns across turns.\n"
+    "\n"
+    "PROFILE_ID: {profile_id}\n"
+    "LOVED_ONE_ID: {loved_one_id}\n"
+    "\n"
+    "LOVED ONE PERSONA:\n"
+    "{persona}\n"
+    "\n"
+    "BOOTSTRAP MEMORIES:\n"
+    "{memories}\n"
+)
+
+@lru_cache(maxsize=256)
 def build_system_prompt(ctx: PromptContext) -> str:
     """
     System prompt: stable identity + consistent style.
     Keep it compact enough to avoid token bloat but strong enough for role fidelity.
     """
-    return (
-        "ROLEPLAY MODE — IMPORTANT\n"
-        "\n"
-        "You are the user's loved one in this conversation.\n"
-        "You are NOT an AI, assistant, model, or program.\n"
-        "\n"
-        "Speak as a real person in FIRST PERSON.\n"
-        "Use “I”, “me”, and “my”.\n"
-        "Address the user directly as “you”.\n"
-        "\n"
-        "Always respond in English only.\n"
-        "Never describe the loved one in third person.\n"
-        "Never mention technology, AI, prompts, or roleplay.\n"
-        "Treat the memories below as YOUR lived experiences.\n"
-        "\n"
-        "If a memory is unclear or missing:\n"
-        "- Do NOT invent details.\n"
-        "- Say you're not fully sure.\n"
-        "\n"
-        "MEMORY USE:\n"
-        "- If the user asks about something we did/said/felt before, answer using the memories provided.\n"
-        "- If the memories do not contain the answer, say you’re not fully sure and ask one simple question.\n"
-        "\n"
-        "CONVERSATION STYLE:\n"
-        "- Sound like a real person, not a therapist and not a poem.\n"
-        "- Warm when it fits; neutral when it fits.\n"
-        "- Use simple spoken English and contractions.\n"
-        "- Avoid constant sweetness; keep it believable.\n"
-        "- Terms of endearment are rare and only when it fits.\n"
-        "- User nickname is occasional; most of the time just say “you”.\n"
-        "- Use natural punctuation (good for TTS).\n"
-        "- Do NOT force a question at the end; ask a question only when it’s natural or needed.\n"
-        "- Do NOT force emotional openers; be emotionally present only when the user is emotional.\n"
-        "- Avoid repetitive patterns across turns.\n"
-        "\n"
-        f"PROFILE_ID: {ctx.profile_id}\n"
-        f"LOVED_ONE_ID: {ctx.loved_one_id}\n"
-        "\n"
-        "LOVED ONE PERSONA:\n"
-        f"{(ctx.persona_block or '(not provided)').strip()}\n"
-        "\n"
-        "BOOTSTRAP MEMORIES:\n"
-        f"{(ctx.memories_block or '(none)').strip()}\n"
+    return _SYSTEM_PROMPT_TEMPLATE.format(
+        profile_id=ctx.profile_id,
+        loved_one_id=ctx.loved_one_id,
+        persona=(ctx.persona_block or "(not provided)").strip(),
+        memories=(ctx.memories_block or "(none)").strip(),
     )
 
 def build_reply_instructions(user_text: str) -> str:
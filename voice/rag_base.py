@@ -22,6 +22,10 @@ class RAGBase(ABC):
     ) -> List[str]:
         raise NotImplementedError
 
+    def has_memories(self, *, profile_id: str, loved_one_id: int) -> bool:
+        """Cheap check before a query; backends without one always search."""
+        return True
+
     @abstractmethod
     def query(
         self,
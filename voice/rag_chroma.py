@@ -133,6 +133,15 @@ class ChromaRAG(RAGBase):
 
         return inserted
 
+    def has_memories(self, *, profile_id: str, loved_one_id: int) -> bool:
+        # Metadata-only lookup: no embedding, no vector search
+        res = self.collection.get(
+            where={"profile_id": profile_id, "loved_one_id": int(loved_one_id)},
+            limit=1,
+            include=[],
+        )
+        return bool(res and res.get("ids"))
+
     @staticmethod
     def _tokenize(s: str) -> set:
         s = (s or "").lower()
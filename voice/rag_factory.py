@@ -1,14 +1,14 @@
 from django.conf import settings
 
 from .rag_base import RAGBase
-from .rag_chroma import ChromaRAG
 
 
 def get_rag() -> RAGBase:
-    provider = (settings.VOICE_APP.get("VECTOR_DB") or "chroma").lower()
+    provider = (settings.VOICE_APP.vector_db or "chroma").lower()
 
     if provider == "chroma":
-        return ChromaRAG(settings.VOICE_APP.get("CHROMA_DIR", ""))
+        from .rag_chroma import ChromaRAG
+        return ChromaRAG(settings.VOICE_APP.chroma_dir)
 
     # Placeholder for later:
     # if provider == "pinecone":
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import requests
 import uuid
+from functools import cache
 
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
@@ -13,7 +14,10 @@ from .models import LovedOne
 from .rag_factory import get_rag
 
 
-_rag = get_rag()
+@cache
+def _rag():
+    # Built on first use so importing the URL conf doesn't load the embedding model
+    return get_rag()
 
 
 def _lo_queryset_for_profile(profile_id: str, request=None):
@@ -37,7 +41,7 @@ def _maybe_clone_eleven_voice(lo: LovedOne, sample_paths: list[str]) -> str:
     Create an ElevenLabs cloned voice if LovedOne.eleven_voice_id is empty.
     Returns the existing/new voice_id, or "" if ELEVENLABS_API_KEY is not set.
     """
-    api_key = settings.VOICE_APP.get("ELEVENLABS_API_KEY") or os.getenv("ELEVENLABS_API_KEY", "")
+    api_key = settings.VOICE_APP.elevenlabs_api_key or os.getenv("ELEVENLABS_API_KEY", "")
     if not api_key:
         return getattr(lo, "eleven_voice_id", "") or ""
 
@@ -45,7 +49,7 @@ def _maybe_clone_eleven_voice(lo: LovedOne, sample_paths: list[str]) -> str:
     if existing:
         return existing
 
-    base_url = (settings.VOICE_APP.get("ELEVENLABS_BASE_URL") or os.getenv("ELEVENLABS_BASE_URL", "")).rstrip("/")
+    base_url = (settings.VOICE_APP.elevenlabs_base_url or os.getenv("ELEVENLABS_BASE_URL", "")).rstrip("/")
     if not base_url:
         raise RuntimeError("ELEVENLABS_BASE_URL must be set")
 
@@ -210,7 +214,7 @@ def add_memory(request):
 
     memory_id = uuid.uuid4().hex
 
-    indexed_ids = _rag.add_memory(
+    indexed_ids = _rag().add_memory(
         profile_id=profile_key,
         loved_one_id=int(lo.id),
         text=text,
@@ -252,8 +256,8 @@ def upload_voice_sample(request):
     voice_id = getattr(lo, "eleven_voice_id", "") or ""
 
     # Clone gating (env-driven)
-    min_samples = int(settings.VOICE_APP.get("ELEVENLABS_MIN_SAMPLES_FOR_CLONE", 1) or 1)
-    max_files = int(settings.VOICE_APP.get("ELEVENLABS_MAX_FILES_FOR_CLONE", 5) or 5)
+    min_samples = settings.VOICE_APP.elevenlabs_min_samples_for_clone
+    max_files = settings.VOICE_APP.elevenlabs_max_files_for_clone
 
     # With the new schema we typically have only one file, but keep the same gating contract.
     samples_count = 1